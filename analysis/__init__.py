@@ -21,21 +21,37 @@ __version__ = "1.0.0"
 __author__ = "Aditya Chaudhary"
 __email__ = "adityachaudhary1306@gmail.com"
 
-# Import main analysis functions for easy access
-try:
-    from .author_activity import analyze_author_activity, plot_author_activity, print_author_insights
-    from .brand_topic_analysis import analyze_brand_mentions, plot_brand_topic_analysis, print_brand_topic_insights
-    from .network_analysis import (
-        create_discussion_network, 
-        analyze_network_structure, 
-        analyze_discussion_patterns, 
-        plot_network_analysis, 
-        print_network_insights
-    )
-    from .run_complete_analysis import run_complete_analysis
-except ImportError:
-    # Allow imports to fail gracefully if dependencies are not installed
-    pass
+# Public functions are resolved lazily (PEP 562) so that importing the package,
+# or a light submodule such as analysis.efficiency_eval, does not pull in
+# networkx, scipy and the other analysis dependencies until one of these names
+# is first used.
+_LAZY_EXPORTS = {
+    'analyze_author_activity': '.author_activity',
+    'plot_author_activity': '.author_activity',
+    'print_author_insights': '.author_activity',
+    'analyze_brand_mentions': '.brand_topic_analysis',
+    'plot_brand_topic_analysis': '.brand_topic_analysis',
+    'print_brand_topic_insights': '.brand_topic_analysis',
+    'create_discussion_network': '.network_analysis',
+    'analyze_network_structure': '.network_analysis',
+    'analyze_discussion_patterns': '.network_analysis',
+    'plot_network_analysis': '.network_analysis',
+    'print_network_insights': '.network_analysis',
+    'run_complete_analysis': '.run_complete_analysis',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package; this also replaces the submodule object that the
+    # import binds under the same name as run_complete_analysis()
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'analyze_author_activity',
@@ -0,0 +1,93 @@
+"""Columnar caches of the crawler's nodes.csv and edges.csv.
+
+nodes.csv stores per-node attributes as a JSON string, so every analysis that
+needs one of them (e.g. a post's subreddit) would otherwise re-parse it.
+materialize_nodes() expands the attributes the analyses use into real columns
+once and writes nodes.parquet next to the CSV; materialize_edges() does the
+same for edges.csv. load_nodes() / load_edges() read those caches with column
+projection and rebuild them whenever the CSV is newer.
+"""
+from __future__ import annotations
+
+import os
+from typing import Callable, List, Optional
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# attrs_json keys promoted to their own columns
+NODE_ATTR_COLUMNS = ("subreddit",)
+
+# Declared CSV schemas, so the reader skips type inference. node_type and
+# edge_type are written as plain strings (Parquet dictionary-encodes them on
+# disk) and read back as categoricals, see CATEGORICAL_COLUMNS.
+NODE_COLUMN_TYPES = {"node_id": pa.string(), "node_type": pa.string(), "attrs_json": pa.string()}
+EDGE_COLUMN_TYPES = {"src_id": pa.string(), "dst_id": pa.string(), "edge_type": pa.string(),
+                     "weight": pa.float64(), "attrs_json": pa.string()}
+
+
+# Low-cardinality type columns loaded as pandas categoricals, so the analyses'
+# type filters compare small integer codes
+CATEGORICAL_COLUMNS = ("node_type", "edge_type")
+
+
+def parquet_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def _read_csv(csv_file: str, column_types: dict) -> pd.DataFrame:
+    # pyarrow's multi-threaded reader; empty fields become nulls as with pd.read_csv
+    table = pa_csv.read_csv(
+        csv_file,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+    )
+    return table.to_pandas()
+
+
+def _write_parquet(df: pd.DataFrame, parquet_file: str) -> None:
+    # Write then rename so concurrent readers never see a partial file
+    tmp_file = f"{parquet_file}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_file, engine="pyarrow", compression="zstd", index=False)
+    os.replace(tmp_file, parquet_file)
+
+
+def materialize_nodes(nodes_file: str, parquet_file: Optional[str] = None) -> str:
+    """Write nodes_file as Parquet with NODE_ATTR_COLUMNS expanded; returns the path."""
+    parquet_file = parquet_file or parquet_path(nodes_file)
+    nodes_df = _read_csv(nodes_file, NODE_COLUMN_TYPES)
+    attrs = [orjson.loads(s) if isinstance(s, str) else {} for s in nodes_df["attrs_json"]]
+    for key in NODE_ATTR_COLUMNS:
+        nodes_df[key] = pd.Series([a.get(key) for a in attrs], index=nodes_df.index, dtype=object)
+    _write_parquet(nodes_df, parquet_file)
+    return parquet_file
+
+
+def materialize_edges(edges_file: str, parquet_file: Optional[str] = None) -> str:
+    """Write edges_file as Parquet; returns the path."""
+    parquet_file = parquet_file or parquet_path(edges_file)
+    _write_parquet(_read_csv(edges_file, EDGE_COLUMN_TYPES), parquet_file)
+    return parquet_file
+
+
+def _load_cached(csv_file: str, materialize: Callable[[str, str], str],
+                 columns: Optional[List[str]]) -> pd.DataFrame:
+    parquet_file = parquet_path(csv_file)
+    if not os.path.exists(parquet_file) or os.path.getmtime(parquet_file) < os.path.getmtime(csv_file):
+        materialize(csv_file, parquet_file)
+    # Read the dictionary-encoded type columns straight into categoricals
+    read_dictionary = [c for c in CATEGORICAL_COLUMNS if columns is None or c in columns]
+    return pd.read_parquet(parquet_file, columns=columns, read_dictionary=read_dictionary)
+
+
+def load_nodes(nodes_file: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load nodes with attributes pre-parsed, (re)building the Parquet cache if stale."""
+    return _load_cached(nodes_file, materialize_nodes, columns)
+
+
+def load_edges(edges_file: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load edges from the Parquet cache, (re)building it if stale."""
+    return _load_cached(edges_file, materialize_edges, columns)
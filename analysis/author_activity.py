@@ -1,74 +1,89 @@
 """Analysis of author activity patterns in the EV dataset."""
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from ._materialize import load_edges, load_nodes
+except ImportError:  # imported as a top-level module by run_complete_analysis
+    from _materialize import load_edges, load_nodes
 
 def analyze_author_activity(nodes_file: str = 'data/processed/nodes.csv', 
-                          edges_file: str = 'data/processed/edges.csv') -> Dict:
+                          edges_file: str = 'data/processed/edges.csv',
+                          nodes_df: Optional[pd.DataFrame] = None,
+                          edges_df: Optional[pd.DataFrame] = None) -> Dict:
     """
     Analyze author activity patterns in the EV discussion data.
     
     Args:
         nodes_file: Path to nodes CSV file
         edges_file: Path to edges CSV file
+        nodes_df: Already-loaded nodes (needs node_type); read from nodes_file if omitted
+        edges_df: Already-loaded edges (needs src_id, dst_id, edge_type, weight);
+            read from edges_file if omitted
         
     Returns:
         Dictionary containing various author activity metrics
     """
     
-    # Load data
-    nodes_df = pd.read_csv(nodes_file)
-    edges_df = pd.read_csv(edges_file)
+    # Load only the columns this analysis reads from the Parquet caches
+    if nodes_df is None:
+        nodes_df = load_nodes(nodes_file, columns=['node_type'])
+    if edges_df is None:
+        edges_df = load_edges(edges_file, columns=['src_id', 'dst_id', 'edge_type', 'weight'])
     
-    # Filter for authors only
-    authors_df = nodes_df[nodes_df['node_type'] == 'author'].copy()
+    # Count authors only
+    total_authors = int((nodes_df['node_type'] == 'author').sum())
     
     # Get authorship relationships (posts and comments authored by users)
     authored_edges = edges_df[edges_df['edge_type'] == 'AUTHORED_BY'].copy()
     
     # Count posts and comments per author
-    author_activity = authored_edges.groupby('dst_id').agg({
-        'src_id': 'count',  # Total items authored
-        'weight': 'sum'     # Total weight (should be same as count for AUTHORED_BY)
-    }).reset_index()
-    author_activity.columns = ['author_id', 'total_authored', 'total_weight']
-    
-    # Separate posts vs comments
-    post_authors = authored_edges[authored_edges['src_id'].str.contains('reddit:post:')]
-    comment_authors = authored_edges[authored_edges['src_id'].str.contains('reddit:comment:')]
-    
-    posts_per_author = post_authors.groupby('dst_id').size().reset_index()
-    posts_per_author.columns = ['author_id', 'posts_count']
-    
-    comments_per_author = comment_authors.groupby('dst_id').size().reset_index()
-    comments_per_author.columns = ['author_id', 'comments_count']
-    
-    # Merge all activity data
-    activity_summary = author_activity.merge(
-        posts_per_author, on='author_id', how='left'
-    ).merge(
-        comments_per_author, on='author_id', how='left'
-    ).fillna(0)
-    
-    # Convert counts to integers
-    activity_summary['posts_count'] = activity_summary['posts_count'].astype(int)
-    activity_summary['comments_count'] = activity_summary['comments_count'].astype(int)
+    by_author = authored_edges.groupby('dst_id')
+    total_authored = by_author.size()
+    authors_index = total_authored.index
+    
+    # Separate posts vs comments (plain prefix checks, no regex)
+    src_ids = authored_edges['src_id']
+    is_post = src_ids.str.startswith('reddit:post:', na=False)
+    is_comment = src_ids.str.startswith('reddit:comment:', na=False)
+    posts_per_author = authored_edges.loc[is_post, 'dst_id'].value_counts()
+    comments_per_author = authored_edges.loc[is_comment, 'dst_id'].value_counts()
+    
+    # All series share the author index, so a single concat aligns them; reindex
+    # with fill_value keeps the counts int64 instead of upcasting through NaN
+    activity_summary = pd.concat([
+        total_authored.rename('total_authored'),                  # Total items authored
+        by_author['weight'].sum().rename('total_weight'),         # Should equal count for AUTHORED_BY
+        posts_per_author.reindex(authors_index, fill_value=0).rename('posts_count'),
+        comments_per_author.reindex(authors_index, fill_value=0).rename('comments_count'),
+    ], axis=1).rename_axis('author_id').reset_index()
     
     # Calculate engagement ratio (comments per post)
-    activity_summary['engagement_ratio'] = activity_summary.apply(
-        lambda row: row['comments_count'] / max(row['posts_count'], 1), axis=1
+    activity_summary['engagement_ratio'] = (
+        activity_summary['comments_count'] / activity_summary['posts_count'].clip(lower=1)
+    )
+    
+    # Partial selection of the most active authors; the full summary stays unsorted.
+    # keep='all' retains every author tied at the cut-off, and ties are then
+    # broken by author_id so the top 20 do not depend on row order
+    top_authors_df = (
+        activity_summary.nlargest(20, 'total_authored', keep='all')
+        .sort_values(['total_authored', 'author_id'], ascending=[False, True], kind='stable')
+        .head(20)
     )
     
-    # Sort by total activity
-    activity_summary = activity_summary.sort_values('total_authored', ascending=False)
+    # Quartiles computed once per column and reused across the engagement buckets
+    posts = activity_summary['posts_count']
+    comments = activity_summary['comments_count']
+    q25_posts, q50_posts, q75_posts = posts.quantile([0.25, 0.5, 0.75]).to_numpy()
+    q25_comments, q50_comments, q75_comments = comments.quantile([0.25, 0.5, 0.75]).to_numpy()
     
     # Create analysis results
     results = {
-        'total_authors': len(authors_df),
+        'total_authors': total_authors,
         'active_authors': len(activity_summary[activity_summary['total_authored'] > 0]),
-        'top_authors': activity_summary.head(20).to_dict('records'),
+        'top_authors': top_authors_df.to_dict('records'),
         'activity_distribution': {
             'mean_posts_per_author': activity_summary['posts_count'].mean(),
             'mean_comments_per_author': activity_summary['comments_count'].mean(),
@@ -78,20 +93,12 @@ def analyze_author_activity(nodes_file: str = 'data/processed/nodes.csv',
             'max_comments_by_single_author': activity_summary['comments_count'].max()
         },
         'engagement_patterns': {
-            'high_posters_low_commenters': len(activity_summary[
-                (activity_summary['posts_count'] > activity_summary['posts_count'].quantile(0.75)) &
-                (activity_summary['comments_count'] < activity_summary['comments_count'].quantile(0.25))
-            ]),
-            'high_commenters_low_posters': len(activity_summary[
-                (activity_summary['comments_count'] > activity_summary['comments_count'].quantile(0.75)) &
-                (activity_summary['posts_count'] < activity_summary['posts_count'].quantile(0.25))
-            ]),
-            'balanced_contributors': len(activity_summary[
-                (activity_summary['posts_count'] > activity_summary['posts_count'].quantile(0.5)) &
-                (activity_summary['comments_count'] > activity_summary['comments_count'].quantile(0.5))
-            ])
+            'high_posters_low_commenters': int(((posts > q75_posts) & (comments < q25_comments)).sum()),
+            'high_commenters_low_posters': int(((comments > q75_comments) & (posts < q25_posts)).sum()),
+            'balanced_contributors': int(((posts > q50_posts) & (comments > q50_comments)).sum())
         },
-        'activity_summary_df': activity_summary
+        'activity_summary_df': activity_summary,
+        'top_authors_df': top_authors_df
     }
     
     return results
@@ -105,6 +112,8 @@ def plot_author_activity(results: Dict, save_path: str = None) -> None:
         save_path: Optional path to save the plot
     """
     
+    import matplotlib.pyplot as plt  # deferred so analysis-only imports skip matplotlib
+    
     activity_df = results['activity_summary_df']
     
     # Create a figure with subplots
@@ -112,7 +121,7 @@ def plot_author_activity(results: Dict, save_path: str = None) -> None:
     fig.suptitle('Author Activity Analysis - EV Discussions', fontsize=16, fontweight='bold')
     
     # 1. Top 20 most active authors
-    top_20 = activity_df.head(20)
+    top_20 = results['top_authors_df']
     ax1 = axes[0, 0]
     bars = ax1.bar(range(len(top_20)), top_20['total_authored'], 
                    color='steelblue', alpha=0.7)
@@ -192,12 +201,19 @@ def print_author_insights(results: Dict) -> None:
     print(f"  • Participation Rate: {results['active_authors']/results['total_authors']*100:.1f}%")
     
     print(f"\n🏆 TOP 5 MOST ACTIVE AUTHORS:")
-    for i, author in enumerate(results['top_authors'][:5], 1):
-        author_name = author['author_id'].split(':')[-1]  # Extract username
+    top_5 = results['top_authors_df'].head(5)
+    usernames = top_5['author_id'].str.rsplit(':', n=1).str[-1].tolist()  # Extract usernames
+    for i, (author_name, total, posts, comments, ratio) in enumerate(zip(
+        usernames,
+        top_5['total_authored'].tolist(),
+        top_5['posts_count'].tolist(),
+        top_5['comments_count'].tolist(),
+        top_5['engagement_ratio'].tolist(),
+    ), 1):
         print(f"  {i}. {author_name}")
-        print(f"     • Total Activity: {author['total_authored']} items")
-        print(f"     • Posts: {author['posts_count']}, Comments: {author['comments_count']}")
-        print(f"     • Engagement Ratio: {author['engagement_ratio']:.1f} comments/post")
+        print(f"     • Total Activity: {total} items")
+        print(f"     • Posts: {posts}, Comments: {comments}")
+        print(f"     • Engagement Ratio: {ratio:.1f} comments/post")
     
     dist = results['activity_distribution']
     print(f"\n📊 ACTIVITY DISTRIBUTION:")
@@ -225,5 +241,6 @@ if __name__ == "__main__":
     plot_author_activity(results, save_path='plots/author_activity_analysis.png')
     
     # Save detailed results to CSV
-    results['activity_summary_df'].to_csv('analysis/author_activity_results.csv', index=False)
+    results['activity_summary_df'].sort_values('total_authored', ascending=False).to_csv(
+        'analysis/author_activity_results.csv', index=False)
     print("\n✅ Detailed results saved to 'analysis/author_activity_results.csv'")
\ No newline at end of file
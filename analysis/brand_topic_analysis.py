@@ -1,32 +1,50 @@
 """Analysis of brand mentions and topic patterns in the EV dataset."""
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import networkx as nx
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from collections import Counter
-import json
+
+import orjson
+
+try:
+    from ._materialize import load_edges, load_nodes
+except ImportError:  # imported as a top-level module by run_complete_analysis
+    from _materialize import load_edges, load_nodes
 
 def analyze_brand_mentions(nodes_file: str = 'data/processed/nodes.csv', 
-                          edges_file: str = 'data/processed/edges.csv') -> Dict:
+                          edges_file: str = 'data/processed/edges.csv',
+                          nodes_df: Optional[pd.DataFrame] = None,
+                          edges_df: Optional[pd.DataFrame] = None) -> Dict:
     """
     Analyze brand mentions and topic patterns in the EV discussion data.
     
     Args:
         nodes_file: Path to nodes CSV file
         edges_file: Path to edges CSV file
+        nodes_df: Already-loaded nodes (needs node_id, node_type, subreddit);
+            read from nodes_file if omitted
+        edges_df: Already-loaded edges (needs src_id, dst_id, edge_type, weight);
+            read from edges_file if omitted
         
     Returns:
         Dictionary containing brand mention analysis and topic insights
     """
     
-    # Load data
-    nodes_df = pd.read_csv(nodes_file)
-    edges_df = pd.read_csv(edges_file)
+    # Load data from the Parquet caches: nodes with subreddit already parsed out
+    # of attrs_json, and only the edge columns read below
+    if nodes_df is None:
+        nodes_df = load_nodes(nodes_file, columns=['node_id', 'node_type', 'subreddit'])
+    if edges_df is None:
+        edges_df = load_edges(edges_file, columns=['src_id', 'dst_id', 'edge_type', 'weight'])
+    
+    # Partition edges by type in a single pass; the subsets are only read below
+    empty_edges = edges_df.iloc[0:0]
+    edges_by_type = dict(list(edges_df.groupby('edge_type', sort=False, observed=True)))
     
     # Get brand mentions
-    brand_edges = edges_df[edges_df['edge_type'] == 'MENTIONS_BRAND'].copy()
+    brand_edges = edges_by_type.get('MENTIONS_BRAND', empty_edges)
     
     # Count brand mentions by weight (frequency)
     brand_counts = brand_edges.groupby('src_id')['weight'].sum().reset_index()
@@ -35,54 +53,60 @@ def analyze_brand_mentions(nodes_file: str = 'data/processed/nodes.csv',
     
     # Get posts and their metadata
     posts_df = nodes_df[nodes_df['node_type'] == 'post'].copy()
+    posts_df['subreddit'] = posts_df['subreddit'].fillna('Unknown')
     
-    # Parse attributes to get subreddit info
-    posts_df['subreddit'] = posts_df['attrs_json'].apply(
-        lambda x: json.loads(x).get('subreddit', 'Unknown') if x != '{}' else 'Unknown'
-    )
-    
-    # Merge brand mentions with post metadata
-    posts_with_brands = brand_counts.merge(
-        posts_df[['node_id', 'subreddit']], 
-        left_on='post_id', right_on='node_id', 
-        how='left'
-    )
+    # Attach post metadata via an index join on node_id; node_id is kept as a
+    # column too, so the records carry it as the left merge on node_id did
+    post_lookup = posts_df.set_index('node_id', drop=False)[['node_id', 'subreddit']]
+    posts_with_brands = brand_counts.join(post_lookup, on='post_id')
     
     # Analyze domain patterns
-    domain_edges = edges_df[edges_df['edge_type'] == 'LINKS_TO_DOMAIN'].copy()
-    domain_counts = domain_edges['dst_id'].value_counts().head(20)
+    domain_edges = edges_by_type.get('LINKS_TO_DOMAIN', empty_edges)
     
-    # Get most frequently linked domains
-    top_domains = domain_counts.to_dict()
+    # Get most frequently linked domains (heap-based top-k, no full sort)
+    top_domains = dict(Counter(domain_edges['dst_id'].to_numpy()).most_common(20))
     
     # Analyze container (subreddit) activity
-    container_edges = edges_df[edges_df['edge_type'] == 'IN_CONTAINER'].copy()
+    container_edges = edges_by_type.get('IN_CONTAINER', empty_edges)
     container_counts = container_edges['dst_id'].value_counts()
     
+    # Histogram of mentions per post. Mention weights are whole match counts, so
+    # a bincount over them replaces hashing every value. The dict matches
+    # value_counts() on the (descending) brand_counts: float keys, most common
+    # first, ties by larger value first
+    mention_counts = brand_counts['brand_mentions'].to_numpy()
+    if np.array_equal(mention_counts, np.floor(mention_counts)) and (mention_counts >= 0).all():
+        histogram = np.bincount(mention_counts.astype(np.int64))
+        present = np.flatnonzero(histogram)
+        order = np.lexsort((-present, -histogram[present]))
+        posts_by_brand_count = {float(present[i]): int(histogram[present[i]]) for i in order}
+    else:
+        posts_by_brand_count = brand_counts['brand_mentions'].value_counts().to_dict()
+    
     # Calculate brand mention distribution
     brand_distribution = {
         'total_posts_with_brands': len(brand_counts),
         'total_brand_mentions': brand_counts['brand_mentions'].sum(),
         'avg_brands_per_post': brand_counts['brand_mentions'].mean(),
         'max_brands_in_post': brand_counts['brand_mentions'].max(),
-        'posts_by_brand_count': brand_counts['brand_mentions'].value_counts().to_dict()
+        'posts_by_brand_count': posts_by_brand_count
     }
     
     # Find posts with most brand mentions
     top_brand_posts = posts_with_brands.head(10).to_dict('records')
     
     # Analyze subreddit patterns
-    subreddit_brand_activity = posts_with_brands.groupby('subreddit').agg({
-        'brand_mentions': ['count', 'sum', 'mean']
-    }).round(2)
-    
-    subreddit_brand_activity.columns = ['posts_with_brands', 'total_brand_mentions', 'avg_brands_per_post']
+    subreddit_brand_activity = posts_with_brands.groupby('subreddit').agg(
+        posts_with_brands=('brand_mentions', 'count'),
+        total_brand_mentions=('brand_mentions', 'sum'),
+        avg_brands_per_post=('brand_mentions', 'mean'),
+    ).round(2)
     subreddit_brand_activity = subreddit_brand_activity.reset_index().sort_values(
         'total_brand_mentions', ascending=False
     )
     
     # Content analysis - get reply patterns
-    reply_edges = edges_df[edges_df['edge_type'] == 'REPLY_TO'].copy()
+    reply_edges = edges_by_type.get('REPLY_TO', empty_edges)
     reply_patterns = {
         'total_replies': len(reply_edges),
         'posts_with_replies': reply_edges['dst_id'].nunique(),
@@ -90,7 +114,7 @@ def analyze_brand_mentions(nodes_file: str = 'data/processed/nodes.csv',
     }
     
     # Identify discussion threads (posts with many replies)
-    popular_threads = reply_edges['dst_id'].value_counts().head(10)
+    popular_threads = dict(Counter(reply_edges['dst_id'].to_numpy()).most_common(10))
     
     results = {
         'brand_analysis': {
@@ -105,7 +129,7 @@ def analyze_brand_mentions(nodes_file: str = 'data/processed/nodes.csv',
         },
         'engagement_analysis': {
             'reply_patterns': reply_patterns,
-            'popular_threads': popular_threads.to_dict(),
+            'popular_threads': popular_threads,
             'container_activity': container_counts.to_dict()
         },
         'data_summary': {
@@ -117,6 +141,24 @@ def analyze_brand_mentions(nodes_file: str = 'data/processed/nodes.csv',
     
     return results
 
+def save_brand_topic_results(results: Dict, output_file: str) -> None:
+    """
+    Write brand/topic results as indented JSON in a single serialization pass.
+    
+    Numpy scalars are emitted as numbers and non-string keys are stringified;
+    anything else orjson cannot encode falls back to str().
+    
+    Args:
+        results: Results from analyze_brand_mentions
+        output_file: Path of the JSON file to write
+    """
+    
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            results, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+
 def plot_brand_topic_analysis(results: Dict, save_path: str = None) -> None:
     """
     Create visualizations for brand and topic analysis.
@@ -126,6 +168,8 @@ def plot_brand_topic_analysis(results: Dict, save_path: str = None) -> None:
         save_path: Optional path to save the plot
     """
     
+    import matplotlib.pyplot as plt  # deferred so analysis-only imports skip matplotlib
+    
     # Create figure with subplots
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('Brand Mentions and Topic Analysis - EV Discussions', fontsize=16, fontweight='bold')
@@ -299,10 +343,6 @@ if __name__ == "__main__":
     plot_brand_topic_analysis(results, save_path='plots/brand_topic_analysis.png')
     
     # Save results to JSON for further analysis
-    import json
-    with open('analysis/brand_topic_results.json', 'w') as f:
-        # Convert any non-serializable objects to strings
-        serializable_results = json.loads(json.dumps(results, default=str))
-        json.dump(serializable_results, f, indent=2)
+    save_brand_topic_results(results, 'analysis/brand_topic_results.json')
     
     print("\n✅ Detailed results saved to 'analysis/brand_topic_results.json'")
\ No newline at end of file
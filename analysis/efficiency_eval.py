@@ -6,35 +6,68 @@ Computes:
 - dedup_rate (dedup_skipped / (items_written + dedup_skipped))
 - items_per_api_call (items_written / success_calls)
 - api_efficiency (success_calls / (success_calls + error_calls))
+
+Totals are summed across all crawl sessions by default (--mode cumulative);
+--mode snapshot uses only the most recent session row.
 """
 from __future__ import annotations
 
+import argparse
+import csv
 import os
-import pandas as pd
+import warnings
+
+import numpy as np
+
+# Counter columns read from metrics.csv and summed per run
+SUM_COLUMNS = ("elapsed_sec", "items_written", "items_fetched", "success_calls", "error_calls", "dedup_skipped")
+
+
+def _load_metrics(metrics_path: str):
+    """Load the counter columns of metrics.csv; None if missing or empty."""
+    if not os.path.exists(metrics_path):
+        print("metrics.csv not found.")
+        return None
+    # A header-only file makes genfromtxt warn about empty input; that case is
+    # reported below instead
+    data = None
+    if os.path.getsize(metrics_path) > 0:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            data = np.genfromtxt(metrics_path, delimiter=",", names=True, usecols=SUM_COLUMNS, ndmin=1)
+    if data is None or data.size == 0:
+        print("metrics.csv is empty.")
+        return None
+    return data
 
 
 def main():
+    p = argparse.ArgumentParser()
+    p.add_argument(
+        "--mode",
+        choices=["cumulative", "snapshot"],
+        default="cumulative",
+        help="Sum all crawl sessions or use only the latest one",
+    )
+    args = p.parse_args()
     out_dir = "data/processed"
     metrics_path = os.path.join(out_dir, "metrics.csv")
     tables_dir = os.path.join(out_dir, "tables")
     os.makedirs(tables_dir, exist_ok=True)
     
-    if not os.path.exists(metrics_path):
-        print("metrics.csv not found.")
+    data = _load_metrics(metrics_path)
+    if data is None:
         return
+    if args.mode == "snapshot":
+        data = data[-1:]
         
-    df = pd.read_csv(metrics_path)
-    if df.empty:
-        print("metrics.csv is empty.")
-        return
-        
-    # Sum all metrics across all crawl sessions for cumulative totals
-    total_elapsed = df["elapsed_sec"].sum()
-    total_items_written = df["items_written"].sum()
-    total_items_fetched = df["items_fetched"].sum()
-    total_success_calls = df["success_calls"].sum()
-    total_error_calls = df["error_calls"].sum()
-    total_dedup_skipped = df["dedup_skipped"].sum()
+    # Sum metrics across the selected crawl sessions
+    total_elapsed = float(data["elapsed_sec"].sum())
+    total_items_written = int(data["items_written"].sum())
+    total_items_fetched = int(data["items_fetched"].sum())
+    total_success_calls = int(data["success_calls"].sum())
+    total_error_calls = int(data["error_calls"].sum())
+    total_dedup_skipped = int(data["dedup_skipped"].sum())
 
     # Calculate metrics
     throughput = total_items_written / total_elapsed if total_elapsed > 0 else 0.0
@@ -48,22 +81,22 @@ def main():
     items_per_api_call = total_items_written / total_success_calls if total_success_calls > 0 else 0.0
     fetch_to_write_ratio = total_items_written / total_items_fetched if total_items_fetched > 0 else 0.0
 
-    out = pd.DataFrame(
-        [
-            {
-                "throughput_items_per_sec": throughput,
-                "success_rate": success_rate,
-                "dedup_rate": dedup_rate,
-                "items_per_api_call": items_per_api_call,
-                "fetch_to_write_ratio": fetch_to_write_ratio,
-                "total_api_calls": total_calls,
-                "total_items_written": total_items_written,
-                "total_elapsed_sec": total_elapsed,
-            }
-        ]
-    )
-    out.to_csv(os.path.join(tables_dir, "efficiency_metrics.csv"), index=False)
-    print(f"Wrote efficiency metrics to {os.path.join(tables_dir, 'efficiency_metrics.csv')}")
+    out = {
+        "throughput_items_per_sec": throughput,
+        "success_rate": success_rate,
+        "dedup_rate": dedup_rate,
+        "items_per_api_call": items_per_api_call,
+        "fetch_to_write_ratio": fetch_to_write_ratio,
+        "total_api_calls": total_calls,
+        "total_items_written": total_items_written,
+        "total_elapsed_sec": total_elapsed,
+    }
+    out_path = os.path.join(tables_dir, "efficiency_metrics.csv")
+    with open(out_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(out.keys())
+        writer.writerow(out.values())
+    print(f"Wrote efficiency metrics to {out_path}")
     print(f"Summary: {total_items_written} items written, {total_calls} API calls, {success_rate:.1%} success rate")
 
 
@@ -9,10 +9,15 @@ Computes:
 from __future__ import annotations
 
 import os
-from collections import Counter, defaultdict
-
 import networkx as nx
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+
+try:
+    from ._materialize import load_edges, load_nodes
+except ImportError:  # run as a script from the analysis directory
+    from _materialize import load_edges, load_nodes
 
 
 def _load_graph(out_dir: str):
@@ -20,59 +25,136 @@ def _load_graph(out_dir: str):
     edges_path = os.path.join(out_dir, "edges.csv")
     if not (os.path.exists(nodes_path) and os.path.exists(edges_path)):
         raise FileNotFoundError("nodes.csv or edges.csv not found. Run crawler first.")
-    nodes = pd.read_csv(nodes_path)
-    edges = pd.read_csv(edges_path)
+    nodes = load_nodes(nodes_path, columns=["node_type"])
+    # edge_type comes back categorical, so every per-type filter compares integer codes
+    edges = load_edges(edges_path, columns=["src_id", "dst_id", "edge_type", "weight"])
     return nodes, edges
 
 
 def author_reply_graph(edges: pd.DataFrame) -> nx.DiGraph:
-    # Build mapping from post/comment to author
+    # Build mapping from post/comment to author (last AUTHORED_BY edge wins)
     authored = edges[edges["edge_type"] == "AUTHORED_BY"][["src_id", "dst_id"]]
-    authored_map = {row.src_id: row.dst_id for row in authored.itertuples(index=False)}
+    authored_map = authored.drop_duplicates("src_id", keep="last").set_index("src_id")["dst_id"]
 
-    G = nx.DiGraph()
+    # Resolve both ends of every reply to its author and count author pairs
     replies = edges[edges["edge_type"] == "REPLY_TO"][["src_id", "dst_id"]]
-    for row in replies.itertuples(index=False):
-        a = authored_map.get(row.src_id)
-        b = authored_map.get(row.dst_id)
-        if a and b and a != b:
-            G.add_edge(a, b, weight=G.get_edge_data(a, b, {}).get("weight", 0) + 1)
+    pairs = pd.DataFrame({"a": replies["src_id"].map(authored_map), "b": replies["dst_id"].map(authored_map)})
+    pairs = pairs[pairs["a"].notna() & pairs["b"].notna() & (pairs["a"] != "") & (pairs["b"] != "")]
+    pairs = pairs[pairs["a"] != pairs["b"]]
+    weights = pairs.groupby(["a", "b"], sort=False).size()
+
+    G = nx.DiGraph()
+    G.add_weighted_edges_from((a, b, int(w)) for (a, b), w in weights.items())
     return G
 
 
+def author_adjacency(G: nx.DiGraph):
+    """Return (author ids, weighted CSR adjacency) with rows/cols in id order."""
+    ids = list(G.nodes())
+    if not ids:  # to_scipy_sparse_array rejects an empty graph
+        return ids, sp.csr_array((0, 0), dtype=float)
+    A = nx.to_scipy_sparse_array(G, nodelist=ids, weight="weight", dtype=float, format="csr")
+    return ids, A
+
+
+def pagerank_sparse(A, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+    """PageRank by power iteration over a CSR adjacency.
+
+    Same model and stopping rule as nx.pagerank: out-weights are row-normalized,
+    dangling mass is spread uniformly, and iteration stops once the L1 change
+    drops below n * tol.
+    """
+    n = A.shape[0]
+    if n == 0:  # nx.pagerank returns {} for an empty graph
+        return np.zeros(0)
+    out_weight = np.asarray(A.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inv_out = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition_t = (sp.diags(inv_out) @ A).T.tocsr()
+
+    r = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        prev = r
+        r = alpha * (transition_t @ prev + prev[dangling].sum() / n) + (1.0 - alpha) / n
+        if np.abs(r - prev).sum() < n * tol:
+            break
+    return r
+
+
+def hits_sparse(A, max_iter: int = 1000, tol: float = 1.0e-8):
+    """HITS (hubs, authorities) by power iteration over a CSR adjacency.
+
+    Both vectors are rescaled to a max of 1 every iteration so they can never
+    overflow; iteration stops once the L1 change in hubs drops below tol, and
+    the returned scores are normalized to sum to 1 like nx.hits(normalized=True).
+    """
+    n = A.shape[0]
+    if n == 0:  # nx.hits returns ({}, {}) for an empty graph
+        return np.zeros(0), np.zeros(0)
+    A_t = A.T.tocsr()
+    h = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        prev = h
+        a = A_t @ h
+        a /= a.max()
+        h = A @ a
+        h /= h.max()
+        if np.abs(h - prev).sum() < tol:
+            break
+    a = A_t @ h
+    return h / h.sum(), a / a.sum()
+
+
+def ranked_authors(author_ids, scores, column: str) -> pd.DataFrame:
+    """Authors ordered by descending score; ties keep their input order."""
+    author_ids = np.asarray(author_ids, dtype=object)
+    scores = np.asarray(scores, dtype=np.float64)
+    order = np.argsort(-scores, kind="stable")
+    return pd.DataFrame({"author_id": author_ids[order], column: scores[order]})
+
+
 def domain_weights(edges: pd.DataFrame) -> pd.DataFrame:
-    df = edges[edges["edge_type"] == "LINKS_TO_DOMAIN"]
-    grp = df.groupby("dst_id")["weight"].sum().reset_index()
+    # Aggregate only the two columns needed; categorical domain keys group by codes
+    df = edges.loc[edges["edge_type"] == "LINKS_TO_DOMAIN", ["dst_id", "weight"]]
+    grp = df.groupby(df["dst_id"].astype("category"), observed=True)["weight"].sum().reset_index()
     grp = grp.rename(columns={"dst_id": "domain_id", "weight": "weight"})
     return grp.sort_values("weight", ascending=False)
 
 
 def container_projection(edges: pd.DataFrame) -> pd.DataFrame:
-    # Build mapping author -> set(containers)
+    # Author/container membership by joining each post's container with its
+    # author (last edge per post wins on either side, as with a dict)
     in_container = edges[edges["edge_type"] == "IN_CONTAINER"][["src_id", "dst_id"]]
     authored = edges[edges["edge_type"] == "AUTHORED_BY"][["src_id", "dst_id"]]
-    post_to_container = {row.src_id: row.dst_id for row in in_container.itertuples(index=False)}
-    post_to_author = {row.src_id: row.dst_id for row in authored.itertuples(index=False)}
-
-    author_containers = defaultdict(set)
-    for post_id, container_id in post_to_container.items():
-        author = post_to_author.get(post_id)
-        if author and container_id:
-            author_containers[author].add(container_id)
-
-    # Weighted projection: number of shared authors between containers
-    container_pairs = Counter()
-    for author, conts in author_containers.items():
-        conts = list(conts)
-        for i in range(len(conts)):
-            for j in range(i + 1, len(conts)):
-                a, b = sorted([conts[i], conts[j]])
-                container_pairs[(a, b)] += 1
-
-    rows = [(a, b, w) for (a, b), w in container_pairs.items()]
-    return pd.DataFrame(rows, columns=["container_a", "container_b", "shared_authors"]).sort_values(
-        "shared_authors", ascending=False
+    membership = (
+        in_container.drop_duplicates("src_id", keep="last")
+        .rename(columns={"dst_id": "container"})
+        .merge(authored.drop_duplicates("src_id", keep="last").rename(columns={"dst_id": "author"}), on="src_id")
+    )
+    membership = membership[
+        membership["author"].notna() & membership["container"].notna()
+        & (membership["author"] != "") & (membership["container"] != "")
+    ].drop_duplicates(["author", "container"])
+
+    # Weighted projection: number of shared authors between containers. With B the
+    # author x container incidence matrix, (B.T @ B)[i, j] counts authors active
+    # in both containers; containers are coded in sorted order so the strict
+    # upper triangle yields each pair once as (container_a < container_b).
+    author_codes, author_ids = pd.factorize(membership["author"])
+    container_codes, containers = pd.factorize(membership["container"], sort=True)
+    B = sp.csr_matrix(
+        (np.ones(len(membership), dtype=np.int64), (author_codes, container_codes)),
+        shape=(len(author_ids), len(containers)),
     )
+    shared = sp.triu(B.T @ B, k=1).tocoo()
+
+    return pd.DataFrame(
+        {
+            "container_a": np.asarray(containers, dtype=object)[shared.row],
+            "container_b": np.asarray(containers, dtype=object)[shared.col],
+            "shared_authors": shared.data,
+        }
+    ).sort_values("shared_authors", ascending=False, kind="stable")
 
 
 def main():
@@ -91,20 +173,18 @@ def main():
     num_reply_edges = G.number_of_edges()
     
     if G.number_of_edges() > 0 and G.number_of_nodes() > 1:
-        pr = nx.pagerank(G, alpha=0.85)
-        pd.DataFrame(sorted(pr.items(), key=lambda x: x[1], reverse=True), columns=["author_id", "pagerank"]).to_csv(
+        author_ids, A = author_adjacency(G)
+        pr = pagerank_sparse(A, alpha=0.85)
+        ranked_authors(author_ids, pr, "pagerank").to_csv(
             os.path.join(tables_dir, "author_pagerank.csv"), index=False
         )
-        try:
-            h, a = nx.hits(G, max_iter=1000, normalized=True)
-            pd.DataFrame(sorted(a.items(), key=lambda x: x[1], reverse=True), columns=["author_id", "authority"]).to_csv(
-                os.path.join(tables_dir, "author_hits_authority.csv"), index=False
-            )
-            pd.DataFrame(sorted(h.items(), key=lambda x: x[1], reverse=True), columns=["author_id", "hub"]).to_csv(
-                os.path.join(tables_dir, "author_hits_hub.csv"), index=False
-            )
-        except Exception:
-            pass
+        h, a = hits_sparse(A, max_iter=1000)
+        ranked_authors(author_ids, a, "authority").to_csv(
+            os.path.join(tables_dir, "author_hits_authority.csv"), index=False
+        )
+        ranked_authors(author_ids, h, "hub").to_csv(
+            os.path.join(tables_dir, "author_hits_hub.csv"), index=False
+        )
 
     # Domain weights
     domain_df = domain_weights(edges)
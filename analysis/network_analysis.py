@@ -1,18 +1,26 @@
 """Network analysis of the EV discussion graph structure."""
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import networkx as nx
 import numpy as np
+import orjson
+import scipy.sparse as sp
 from typing import Dict, List, Tuple, Optional
 from collections import Counter
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from ._materialize import load_edges, load_nodes
+except ImportError:  # imported as a top-level module by run_complete_analysis
+    from _materialize import load_edges, load_nodes
+
 def create_discussion_network(nodes_file: str = 'data/processed/nodes.csv',
                             edges_file: str = 'data/processed/edges.csv',
-                            edge_types: List[str] = None) -> nx.Graph:
+                            edge_types: List[str] = None,
+                            nodes_df: Optional[pd.DataFrame] = None,
+                            edges_df: Optional[pd.DataFrame] = None) -> nx.Graph:
     """
     Create a NetworkX graph from the EV discussion data.
     
@@ -20,14 +28,20 @@ def create_discussion_network(nodes_file: str = 'data/processed/nodes.csv',
         nodes_file: Path to nodes CSV file
         edges_file: Path to edges CSV file
         edge_types: List of edge types to include (default: all except MENTIONS_BRAND)
+        nodes_df: Already-loaded nodes (needs node_id, node_type, attrs_json);
+            read from nodes_file if omitted
+        edges_df: Already-loaded edges (needs src_id, dst_id, edge_type, weight);
+            read from edges_file if omitted
         
     Returns:
         NetworkX graph object
     """
     
-    # Load data
-    nodes_df = pd.read_csv(nodes_file)
-    edges_df = pd.read_csv(edges_file)
+    # Load data (only the columns the graph is built from)
+    if nodes_df is None:
+        nodes_df = load_nodes(nodes_file, columns=['node_id', 'node_type', 'attrs_json'])
+    if edges_df is None:
+        edges_df = load_edges(edges_file, columns=['src_id', 'dst_id', 'edge_type', 'weight'])
     
     # Default edge types to include (exclude MENTIONS_BRAND for network structure)
     if edge_types is None:
@@ -39,20 +53,31 @@ def create_discussion_network(nodes_file: str = 'data/processed/nodes.csv',
     # Create graph
     G = nx.Graph()
     
-    # Add nodes with attributes
-    for _, node in nodes_df.iterrows():
-        G.add_node(node['node_id'], 
-                  node_type=node['node_type'],
-                  attrs=node['attrs_json'])
+    # Add nodes with attributes (bulk insert from column arrays)
+    G.add_nodes_from(
+        (node_id, {'node_type': node_type, 'attrs': attrs})
+        for node_id, node_type, attrs in zip(
+            nodes_df['node_id'].tolist(), nodes_df['node_type'].tolist(), nodes_df['attrs_json'].tolist()
+        )
+    )
     
     # Add edges
-    for _, edge in filtered_edges.iterrows():
-        G.add_edge(edge['src_id'], edge['dst_id'],
-                  edge_type=edge['edge_type'],
-                  weight=edge['weight'])
+    G.add_edges_from(
+        (src, dst, {'edge_type': edge_type, 'weight': weight})
+        for src, dst, edge_type, weight in zip(
+            filtered_edges['src_id'].tolist(), filtered_edges['dst_id'].tolist(),
+            filtered_edges['edge_type'].tolist(), filtered_edges['weight'].tolist()
+        )
+    )
     
     return G
 
+def _value_histogram(values: np.ndarray) -> Dict[int, int]:
+    """{value: count} for non-negative integers, in increasing value order."""
+    counts = np.bincount(values)
+    present = np.flatnonzero(counts)
+    return dict(zip(present.tolist(), counts[present].tolist()))
+
 def analyze_network_structure(graph: nx.Graph) -> Dict:
     """
     Analyze the structure and properties of the discussion network.
@@ -66,39 +91,46 @@ def analyze_network_structure(graph: nx.Graph) -> Dict:
     
     print("Analyzing network structure...")
     
+    # Connected components (a single traversal, also answers is_connected)
+    components = list(nx.connected_components(graph))
+    component_sizes = np.fromiter((len(comp) for comp in components), dtype=np.int64, count=len(components))
+    
     # Basic network statistics
     basic_stats = {
         'num_nodes': graph.number_of_nodes(),
         'num_edges': graph.number_of_edges(),
         'density': nx.density(graph),
-        'is_connected': nx.is_connected(graph)
+        'is_connected': len(components) == 1
     }
     
-    # Connected components analysis
-    components = list(nx.connected_components(graph))
-    component_sizes = [len(comp) for comp in components]
-    
     components_info = {
         'num_components': len(components),
-        'largest_component_size': max(component_sizes) if component_sizes else 0,
-        'component_size_distribution': Counter(component_sizes)
+        'largest_component_size': int(component_sizes.max()) if len(components) else 0,
+        'component_size_distribution': _value_histogram(component_sizes)
     }
     
-    # Degree analysis
-    degrees = dict(graph.degree())
-    degree_values = list(degrees.values())
+    # Sparse 0/1 adjacency in graph node order, shared by the degree and
+    # clustering analyses
+    node_list = list(graph)
+    adjacency = (nx.to_scipy_sparse_array(graph, nodelist=node_list, weight=None, format='csr', dtype=np.int32)
+                 if node_list else sp.csr_array((0, 0), dtype=np.int32))
+    
+    # Degree analysis: adjacency row sums, plus the diagonal once more since
+    # graph.degree() counts a self-loop twice
+    degree_values = np.asarray(adjacency.sum(axis=1)).ravel() + adjacency.diagonal()
     
     degree_stats = {
         'avg_degree': np.mean(degree_values),
-        'max_degree': max(degree_values) if degree_values else 0,
-        'min_degree': min(degree_values) if degree_values else 0,
-        'degree_distribution': Counter(degree_values)
+        'max_degree': int(degree_values.max()) if len(degree_values) else 0,
+        'min_degree': int(degree_values.min()) if len(degree_values) else 0,
+        'degree_distribution': _value_histogram(degree_values)
     }
     
-    # Find high-degree nodes (hubs)
-    degree_threshold = np.percentile(degree_values, 95) if degree_values else 0
-    hub_nodes = [(node, deg) for node, deg in degrees.items() if deg >= degree_threshold]
-    hub_nodes.sort(key=lambda x: x[1], reverse=True)
+    # Find high-degree nodes (hubs), highest first; ties keep graph node order
+    degree_threshold = np.percentile(degree_values, 95) if len(degree_values) else 0
+    hub_idx = np.flatnonzero(degree_values >= degree_threshold)
+    hub_idx = hub_idx[np.argsort(-degree_values[hub_idx], kind='stable')]
+    hub_nodes = [(node_list[i], int(degree_values[i])) for i in hub_idx]
     
     # Analyze node types
     node_types = nx.get_node_attributes(graph, 'node_type')
@@ -120,18 +152,18 @@ def analyze_network_structure(graph: nx.Graph) -> Dict:
         degree_centrality = nx.degree_centrality(largest_subgraph)
         top_degree_central = sorted(degree_centrality.items(), key=lambda x: x[1], reverse=True)[:10]
         
-        # Betweenness centrality (sample for large graphs)
-        if len(largest_component) > 1000:
-            # Sample for computational efficiency
-            sample_nodes = np.random.choice(list(largest_component), size=min(500, len(largest_component)), replace=False)
-            betweenness_centrality = nx.betweenness_centrality(largest_subgraph, k=len(sample_nodes))
-        else:
-            betweenness_centrality = nx.betweenness_centrality(largest_subgraph)
+        # Betweenness centrality, estimated from a fixed sample of source nodes
+        # (exact when the component has at most that many nodes)
+        betweenness_centrality = nx.betweenness_centrality(
+            largest_subgraph, k=min(100, len(largest_component)), seed=0, normalized=True
+        )
         
         top_betweenness_central = sorted(betweenness_centrality.items(), key=lambda x: x[1], reverse=True)[:10]
         
-        # Closeness centrality
-        closeness_centrality = nx.closeness_centrality(largest_subgraph)
+        # Closeness centrality, only for the highest-degree candidates since just
+        # the top 10 are reported (one BFS per candidate instead of per node)
+        closeness_candidates = [node for node, _ in sorted(degree_centrality.items(), key=lambda x: x[1], reverse=True)[:100]]
+        closeness_centrality = {node: nx.closeness_centrality(largest_subgraph, u=node) for node in closeness_candidates}
         top_closeness_central = sorted(closeness_centrality.items(), key=lambda x: x[1], reverse=True)[:10]
         
         centrality_measures = {
@@ -140,11 +172,22 @@ def analyze_network_structure(graph: nx.Graph) -> Dict:
             'top_closeness_central': top_closeness_central
         }
     
-    # Clustering analysis
-    clustering_coeffs = nx.clustering(graph)
+    # Clustering analysis from per-node triangle counts, diag(A^3) / 2, on the
+    # sparse adjacency (self-loops dropped, as nx.clustering ignores them)
+    avg_clustering = global_clustering = 0.0
+    if graph.number_of_nodes() > 0:
+        adjacency.setdiag(0)
+        adjacency.eliminate_zeros()
+        node_degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+        triangles = np.asarray((adjacency @ adjacency).multiply(adjacency).sum(axis=1)).ravel() / 2
+        neighbor_pairs = node_degrees * (node_degrees - 1) / 2
+        avg_clustering = float(np.mean(np.divide(triangles, neighbor_pairs,
+                                                 out=np.zeros_like(triangles), where=neighbor_pairs > 0)))
+        if triangles.sum() > 0:
+            global_clustering = float(triangles.sum() / neighbor_pairs.sum())
     clustering_stats = {
-        'avg_clustering': np.mean(list(clustering_coeffs.values())),
-        'global_clustering': nx.transitivity(graph)
+        'avg_clustering': avg_clustering,
+        'global_clustering': global_clustering
     }
     
     results = {
@@ -176,41 +219,72 @@ def analyze_discussion_patterns(graph: nx.Graph, nodes_df: pd.DataFrame, edges_d
     
     print("Analyzing discussion patterns...")
     
-    # Author interaction patterns
-    authors = nodes_df[nodes_df['node_type'] == 'author']['node_id'].tolist()
-    author_subgraph = graph.subgraph(authors)
+    # Split nodes and edges by type once; each lookup below is then a dict access
+    # rather than another full-column compare and boolean copy
+    node_ids_by_type = {node_type: group.tolist() for node_type, group in
+                        nodes_df.groupby('node_type', sort=False, observed=True)['node_id']}
+    empty_edges = edges_df.iloc[0:0]
+    edges_by_type = dict(list(edges_df.groupby('edge_type', sort=False, observed=True)))
+    
+    # Author interaction patterns: count author nodes and author-author edges by
+    # walking only the authors' adjacency, without building a subgraph
+    authors = node_ids_by_type.get('author', [])
+    author_set = set(authors)
+    author_nodes = [author for author in author_set if author in graph]
+    author_connections = sum(1 for _, neighbor in graph.edges(author_nodes) if neighbor in author_set)
     
     # Posts and comments analysis
-    posts = nodes_df[nodes_df['node_type'] == 'post']['node_id'].tolist()
-    comments = nodes_df[nodes_df['node_type'] == 'comment']['node_id'].tolist()
+    posts = node_ids_by_type.get('post', [])
+    comments = node_ids_by_type.get('comment', [])
     
     # Reply chain analysis
-    reply_edges = edges_df[edges_df['edge_type'] == 'REPLY_TO']
-    
-    # Build reply graph to find conversation threads
-    reply_graph = nx.DiGraph()
-    for _, edge in reply_edges.iterrows():
-        reply_graph.add_edge(edge['src_id'], edge['dst_id'])
-    
-    # Find discussion thread depths
-    thread_depths = []
-    for post in posts:
-        if post in reply_graph:
-            # Find all paths from comments to this post
-            depths = []
-            for comment in comments:
-                if comment in reply_graph:
-                    try:
-                        if nx.has_path(reply_graph, comment, post):
-                            path_length = nx.shortest_path_length(reply_graph, comment, post)
-                            depths.append(path_length)
-                    except:
-                        continue
-            if depths:
-                thread_depths.extend(depths)
+    reply_edges = edges_by_type.get('REPLY_TO', empty_edges)
+    
+    # Factorize reply endpoints, posts and comments together so the reply
+    # structure is keyed by int codes and lookups are dense-vector indexing
+    n_replies, n_posts = len(reply_edges), len(posts)
+    node_codes, node_ids = pd.factorize(pd.concat(
+        [reply_edges['src_id'], reply_edges['dst_id'], pd.Series(posts, dtype=object), pd.Series(comments, dtype=object)],
+        ignore_index=True
+    ))
+    src_codes = node_codes[:n_replies]
+    dst_codes = node_codes[n_replies:2 * n_replies]
+    post_codes = node_codes[2 * n_replies:2 * n_replies + n_posts]
+    comment_counts = np.bincount(node_codes[2 * n_replies + n_posts:], minlength=len(node_ids))
+    
+    # Reply adjacency as CSR: row i lists the nodes that replied to node i
+    n_nodes = len(node_ids)
+    replies_to = sp.csr_array(
+        (np.ones(n_replies, dtype=np.int8), (dst_codes, src_codes)), shape=(n_nodes, n_nodes)
+    )
+    
+    # Find discussion thread depths: a level-by-level BFS from each post over
+    # the replies reaches every comment in its thread at that comment's depth
+    visited = np.zeros(n_nodes, dtype=bool)
+    depth_sum = depth_count = max_depth = 0
+    for post in post_codes.tolist():
+        frontier = np.array([post])
+        visited[post] = True
+        reached = [frontier]
+        depth = 0
+        while True:
+            frontier = np.unique(replies_to[frontier].indices)
+            frontier = frontier[~visited[frontier]]
+            if not len(frontier):
+                break
+            depth += 1
+            visited[frontier] = True
+            reached.append(frontier)
+            level_comments = int(comment_counts[frontier].sum())
+            if level_comments:
+                depth_sum += depth * level_comments
+                depth_count += level_comments
+                max_depth = max(max_depth, depth)
+        # Reset only what this BFS touched so each thread is walked independently
+        visited[np.concatenate(reached)] = False
     
     # Cross-platform linking patterns
-    domain_edges = edges_df[edges_df['edge_type'] == 'LINKS_TO_DOMAIN']
+    domain_edges = edges_by_type.get('LINKS_TO_DOMAIN', empty_edges)
     domain_patterns = {
         'total_external_links': len(domain_edges),
         'unique_domains': domain_edges['dst_id'].nunique(),
@@ -219,7 +293,7 @@ def analyze_discussion_patterns(graph: nx.Graph, nodes_df: pd.DataFrame, edges_d
     }
     
     # User engagement patterns
-    authorship_edges = edges_df[edges_df['edge_type'] == 'AUTHORED_BY']
+    authorship_edges = edges_by_type.get('AUTHORED_BY', empty_edges)
     author_activity = authorship_edges['dst_id'].value_counts()
     
     engagement_patterns = {
@@ -232,20 +306,43 @@ def analyze_discussion_patterns(graph: nx.Graph, nodes_df: pd.DataFrame, edges_d
     
     results = {
         'thread_analysis': {
-            'avg_thread_depth': np.mean(thread_depths) if thread_depths else 0,
-            'max_thread_depth': max(thread_depths) if thread_depths else 0,
+            'avg_thread_depth': depth_sum / depth_count if depth_count else 0,
+            'max_thread_depth': max_depth,
             'total_reply_chains': len(reply_edges)
         },
         'domain_patterns': domain_patterns,
         'engagement_patterns': engagement_patterns,
         'author_network': {
-            'connected_authors': len(author_subgraph),
-            'author_connections': author_subgraph.number_of_edges()
+            'connected_authors': len(author_nodes),
+            'author_connections': author_connections
         }
     }
     
     return results
 
+def save_network_results(network_results: Dict, discussion_results: Dict, output_file: str) -> None:
+    """
+    Write both network analyses to one indented JSON file.
+    
+    Integer-keyed histograms keep their keys as strings in the output; values
+    orjson has no encoding for are written as str().
+    
+    Args:
+        network_results: Results from analyze_network_structure
+        discussion_results: Results from analyze_discussion_patterns
+        output_file: Path of the JSON file to write
+    """
+    
+    combined_results = {
+        'network_structure': network_results,
+        'discussion_patterns': discussion_results
+    }
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            combined_results, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+
 def plot_network_analysis(network_results: Dict, discussion_results: Dict, save_path: str = None) -> None:
     """
     Create visualizations for network analysis results.
@@ -256,6 +353,8 @@ def plot_network_analysis(network_results: Dict, discussion_results: Dict, save_
         save_path: Optional path to save the plot
     """
     
+    import matplotlib.pyplot as plt  # deferred so analysis-only imports skip matplotlib
+    
     # Create figure with subplots
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('Network Structure Analysis - EV Discussions', fontsize=16, fontweight='bold')
@@ -342,75 +441,79 @@ def print_network_insights(network_results: Dict, discussion_results: Dict) -> N
         discussion_results: Results from analyze_discussion_patterns
     """
     
-    print("=" * 60)
-    print("🕸️  NETWORK STRUCTURE ANALYSIS - EV DISCUSSIONS")
-    print("=" * 60)
+    # Collect the report and write it in one call instead of one print per line
+    lines = [
+        "=" * 60,
+        "🕸️  NETWORK STRUCTURE ANALYSIS - EV DISCUSSIONS",
+        "=" * 60,
+    ]
     
     # Basic network statistics
     basic = network_results['basic_stats']
-    print(f"\n🌐 NETWORK OVERVIEW:")
-    print(f"  • Total nodes: {basic['num_nodes']:,}")
-    print(f"  • Total edges: {basic['num_edges']:,}")
-    print(f"  • Network density: {basic['density']:.6f}")
-    print(f"  • Is connected: {basic['is_connected']}")
+    lines.append(f"\n🌐 NETWORK OVERVIEW:")
+    lines.append(f"  • Total nodes: {basic['num_nodes']:,}")
+    lines.append(f"  • Total edges: {basic['num_edges']:,}")
+    lines.append(f"  • Network density: {basic['density']:.6f}")
+    lines.append(f"  • Is connected: {basic['is_connected']}")
     
     # Component analysis
     comp = network_results['components']
-    print(f"\n🧩 CONNECTIVITY:")
-    print(f"  • Connected components: {comp['num_components']:,}")
-    print(f"  • Largest component size: {comp['largest_component_size']:,}")
-    print(f"  • Nodes in largest component: {network_results['largest_component_nodes']:,}")
+    lines.append(f"\n🧩 CONNECTIVITY:")
+    lines.append(f"  • Connected components: {comp['num_components']:,}")
+    lines.append(f"  • Largest component size: {comp['largest_component_size']:,}")
+    lines.append(f"  • Nodes in largest component: {network_results['largest_component_nodes']:,}")
     
     # Degree analysis
     degree = network_results['degree_analysis']
-    print(f"\n📈 DEGREE STATISTICS:")
-    print(f"  • Average degree: {degree['avg_degree']:.2f}")
-    print(f"  • Maximum degree: {degree['max_degree']}")
-    print(f"  • Minimum degree: {degree['min_degree']}")
+    lines.append(f"\n📈 DEGREE STATISTICS:")
+    lines.append(f"  • Average degree: {degree['avg_degree']:.2f}")
+    lines.append(f"  • Maximum degree: {degree['max_degree']}")
+    lines.append(f"  • Minimum degree: {degree['min_degree']}")
     
     # Hub nodes
-    print(f"\n🎆 TOP 5 HUB NODES (Highest Degree):")
+    lines.append(f"\n🎆 TOP 5 HUB NODES (Highest Degree):")
     for i, (node, deg) in enumerate(network_results['hub_nodes'][:5], 1):
         node_type = node.split(':')[1] if ':' in node else 'unknown'
         node_id = node.split(':')[-1] if ':' in node else node
-        print(f"  {i}. {node_type.title()} {node_id[:20]}... (degree: {deg})")
+        lines.append(f"  {i}. {node_type.title()} {node_id[:20]}... (degree: {deg})")
     
     # Node types
     node_types = network_results['node_types']
-    print(f"\n📁 NODE TYPE DISTRIBUTION:")
+    lines.append(f"\n📁 NODE TYPE DISTRIBUTION:")
     for node_type, count in node_types.items():
-        print(f"  • {node_type.title()}: {count:,}")
+        lines.append(f"  • {node_type.title()}: {count:,}")
     
     # Discussion patterns
     thread = discussion_results['thread_analysis']
-    print(f"\n💬 DISCUSSION PATTERNS:")
-    print(f"  • Average thread depth: {thread['avg_thread_depth']:.1f}")
-    print(f"  • Maximum thread depth: {thread['max_thread_depth']}")
-    print(f"  • Total reply chains: {thread['total_reply_chains']:,}")
+    lines.append(f"\n💬 DISCUSSION PATTERNS:")
+    lines.append(f"  • Average thread depth: {thread['avg_thread_depth']:.1f}")
+    lines.append(f"  • Maximum thread depth: {thread['max_thread_depth']}")
+    lines.append(f"  • Total reply chains: {thread['total_reply_chains']:,}")
     
     # Engagement patterns
     engage = discussion_results['engagement_patterns']
-    print(f"\n👥 USER ENGAGEMENT:")
-    print(f"  • Active authors: {engage['active_authors']:,}")
-    print(f"  • Participation rate: {engage['participation_rate']:.1f}%")
-    print(f"  • Content creators (>1 post): {engage['content_creators']:,}")
-    print(f"  • Power users (top 10%): {engage['power_users']:,}")
+    lines.append(f"\n👥 USER ENGAGEMENT:")
+    lines.append(f"  • Active authors: {engage['active_authors']:,}")
+    lines.append(f"  • Participation rate: {engage['participation_rate']:.1f}%")
+    lines.append(f"  • Content creators (>1 post): {engage['content_creators']:,}")
+    lines.append(f"  • Power users (top 10%): {engage['power_users']:,}")
     
     # Domain patterns
     domains = discussion_results['domain_patterns']
-    print(f"\n🌐 EXTERNAL LINKING:")
-    print(f"  • Total external links: {domains['total_external_links']:,}")
-    print(f"  • Unique domains linked: {domains['unique_domains']:,}")
-    print(f"  • Posts with external links: {domains['posts_with_links']:,}")
-    print(f"  • Average links per post: {domains['avg_links_per_post']:.1f}")
+    lines.append(f"\n🌐 EXTERNAL LINKING:")
+    lines.append(f"  • Total external links: {domains['total_external_links']:,}")
+    lines.append(f"  • Unique domains linked: {domains['unique_domains']:,}")
+    lines.append(f"  • Posts with external links: {domains['posts_with_links']:,}")
+    lines.append(f"  • Average links per post: {domains['avg_links_per_post']:.1f}")
     
     # Clustering
     clustering = network_results['clustering']
-    print(f"\n🌐 NETWORK CLUSTERING:")
-    print(f"  • Average local clustering: {clustering['avg_clustering']:.4f}")
-    print(f"  • Global clustering coefficient: {clustering['global_clustering']:.4f}")
+    lines.append(f"\n🌐 NETWORK CLUSTERING:")
+    lines.append(f"  • Average local clustering: {clustering['avg_clustering']:.4f}")
+    lines.append(f"  • Global clustering coefficient: {clustering['global_clustering']:.4f}")
     
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     # Load data and create network
@@ -418,8 +521,8 @@ if __name__ == "__main__":
     graph = create_discussion_network()
     
     # Load dataframes for additional analysis
-    nodes_df = pd.read_csv('data/processed/nodes.csv')
-    edges_df = pd.read_csv('data/processed/edges.csv')
+    nodes_df = load_nodes('data/processed/nodes.csv', columns=['node_id', 'node_type'])
+    edges_df = load_edges('data/processed/edges.csv', columns=['src_id', 'dst_id', 'edge_type'])
     
     # Analyze network structure
     network_results = analyze_network_structure(graph)
@@ -435,16 +538,6 @@ if __name__ == "__main__":
                          save_path='plots/network_analysis.png')
     
     # Save results
-    import json
-    combined_results = {
-        'network_structure': network_results,
-        'discussion_patterns': discussion_results
-    }
-    
-    # Convert non-serializable objects to strings
-    serializable_results = json.loads(json.dumps(combined_results, default=str))
-    
-    with open('analysis/network_analysis_results.json', 'w') as f:
-        json.dump(serializable_results, f, indent=2)
+    save_network_results(network_results, discussion_results, 'analysis/network_analysis_results.json')
     
     print("\n✅ Network analysis complete! Results saved to 'analysis/network_analysis_results.json'")
\ No newline at end of file
@@ -3,73 +3,140 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+import pyarrow.json as pa_json
+
+# Types of the posts.jsonl fields read here; everything else in a record is
+# skipped by the parser instead of being materialized as a column
+POST_FIELD_TYPES = {
+    "id": pa.string(),
+    "platform": pa.string(),
+    "kind": pa.string(),
+    "created_iso": pa.string(),
+    "url": pa.string(),
+    "text": pa.string(),
+    "relevance_score": pa.float64(),
+}
+
+
+def read_posts(posts_path: Union[str, Path], columns: List[str]) -> pd.DataFrame:
+    """Read only `columns` from posts.jsonl using Arrow's JSON reader."""
+    if os.path.getsize(posts_path) == 0:
+        return pd.DataFrame(columns=columns)
+    schema = pa.schema([(c, POST_FIELD_TYPES[c]) for c in columns])
+    parse_options = pa_json.ParseOptions(explicit_schema=schema, unexpected_field_behavior="ignore")
+    return pa_json.read_json(posts_path, parse_options=parse_options).select(columns).to_pandas()
+
+
+def _scan_scores(posts_path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Stream posts.jsonl once, returning each record's relevance_score and byte offset."""
+    scores: List[float] = []
+    offsets: List[int] = []
+    offset = 0
+    with open(posts_path, "rb") as fh:
+        for line in fh:
+            if line.strip():
+                score = orjson.loads(line).get("relevance_score")
+                scores.append(np.nan if score is None else score)
+                offsets.append(offset)
+            offset += len(line)
+    return np.asarray(scores, dtype=np.float64), np.asarray(offsets, dtype=np.int64)
 
 
 def prepare_labels(out_dir: str, sample_size: int = 400) -> None:
-    posts_path = os.path.join(out_dir, "posts.jsonl")
-    labels_dir = os.path.join(out_dir, "labels")
-    os.makedirs(labels_dir, exist_ok=True)
-    if not os.path.exists(posts_path):
+    posts_path = Path(out_dir) / "posts.jsonl"
+    labels_dir = Path(out_dir) / "labels"
+    labels_dir.mkdir(parents=True, exist_ok=True)
+    if not posts_path.exists():
         print("posts.jsonl not found; run crawler first.")
         return
-    df = pd.read_json(posts_path, lines=True)
-    if df.empty:
+    # Only (score, offset) pairs are kept for the whole file
+    scores, offsets = _scan_scores(posts_path)
+    if not len(scores):
         print("No records to label.")
         return
-    df = df.sort_values("relevance_score", ascending=False).reset_index(drop=True)
+    # Rank with Series.sort_values so ties and missing scores order as before
+    order = pd.Series(scores).sort_values(ascending=False).index.to_numpy()
     # Quantile-based sampling
-    idxs = np.linspace(0, len(df) - 1, num=min(sample_size, len(df)), dtype=int)
-    sub = df.iloc[idxs][["id", "platform", "kind", "created_iso", "url", "text", "relevance_score"]]
+    idxs = np.linspace(0, len(order) - 1, num=min(sample_size, len(order)), dtype=int)
+    sample_offsets = offsets[order[idxs]].tolist()
+
+    # Second pass: seek to and parse just the sampled records, in file order
+    columns = ["id", "platform", "kind", "created_iso", "url", "text", "relevance_score"]
+    records = {}
+    with open(posts_path, "rb") as fh:
+        for offset in sorted(sample_offsets):
+            fh.seek(offset)
+            records[offset] = orjson.loads(fh.readline())
+    sub = pd.DataFrame([[records[o].get(c) for c in columns] for o in sample_offsets], columns=columns)
     sub["label"] = ""
-    sub.to_csv(os.path.join(labels_dir, "labels.csv"), index=False)
-    print(f"Wrote labeling CSV with {len(sub)} rows to {os.path.join(labels_dir, 'labels.csv')}")
+    labels_path = labels_dir / "labels.csv"
+    sub.to_csv(labels_path, index=False)
+    print(f"Wrote labeling CSV with {len(sub)} rows to {labels_path}")
 
 
-def dcg(scores: List[int]) -> float:
-    return sum((s / np.log2(i + 2)) for i, s in enumerate(scores))
+@lru_cache(maxsize=32)
+def _rank_discounts(n: int) -> np.ndarray:
+    """log2(rank + 1) for ranks 1..n, shared read-only across score_labels calls."""
+    discounts = np.log2(np.arange(2, n + 2, dtype=np.float64))
+    discounts.flags.writeable = False
+    return discounts
 
 
 def analyze_relevance_distribution(out_dir: str) -> None:
     """Analyze actual relevance score distribution from posts.jsonl"""
-    posts_path = os.path.join(out_dir, "posts.jsonl")
-    tables_dir = os.path.join(out_dir, "tables")
-    os.makedirs(tables_dir, exist_ok=True)
+    posts_path = Path(out_dir) / "posts.jsonl"
+    tables_dir = Path(out_dir) / "tables"
+    tables_dir.mkdir(parents=True, exist_ok=True)
     
-    if not os.path.exists(posts_path):
+    if not posts_path.exists():
         print("posts.jsonl not found; run crawler first.")
         return
         
-    df = pd.read_json(posts_path, lines=True)
+    df = read_posts(posts_path, ["relevance_score"])
     if df.empty:
         print("No records found for relevance analysis.")
         return
 
-    # Analyze relevance score distribution
-    scores = df["relevance_score"]
+    # Items with score > relevant_threshold are considered relevant
+    relevant_threshold = 1.0
+    
+    # Sort the (non-missing) scores once; every threshold count below is then a
+    # binary search and the order statistics are direct lookups
+    scores = df["relevance_score"].to_numpy(dtype=np.float64)
+    total_items = len(scores)
+    sorted_scores = np.sort(scores[~np.isnan(scores)])
+    n_scored = len(sorted_scores)
+    zero_start, high_start, very_high_start = np.searchsorted(sorted_scores, [0.0, 3.0, 5.0], side="left")
+    zero_end, relevant_start = np.searchsorted(sorted_scores, [0.0, relevant_threshold], side="right")
     
     # Count items by relevance level
-    zero_score = (scores == 0.0).sum()
-    positive_score = (scores > 0.0).sum()
-    high_score = (scores >= 3.0).sum()
-    very_high_score = (scores >= 5.0).sum()
+    zero_score = int(zero_end - zero_start)
+    positive_score = int(n_scored - zero_end)
+    high_score = int(n_scored - high_start)
+    very_high_score = int(n_scored - very_high_start)
     
     # Basic statistics
-    mean_score = scores.mean()
-    median_score = scores.median()
-    max_score = scores.max()
-    std_score = scores.std()
+    mean_score = sorted_scores.mean() if n_scored else np.nan
+    median_score = np.median(sorted_scores) if n_scored else np.nan
+    max_score = sorted_scores[-1] if n_scored else np.nan
+    std_score = sorted_scores.std(ddof=1) if n_scored > 1 else np.nan
     
-    # Calculate meaningful thresholds based on actual data
-    relevant_threshold = 1.0  # Items with score > 1.0 considered relevant
-    relevant_items = (scores > relevant_threshold).sum()
-    relevance_rate = relevant_items / len(scores) if len(scores) > 0 else 0.0
+    relevant_items = int(n_scored - relevant_start)
+    relevance_rate = relevant_items / total_items if total_items > 0 else 0.0
     
     out = pd.DataFrame([{
-        "total_items": len(scores),
+        "total_items": total_items,
         "zero_score_items": zero_score,
         "positive_score_items": positive_score,
         "high_score_items": high_score,
@@ -82,36 +149,102 @@ def analyze_relevance_distribution(out_dir: str) -> None:
         "relevant_threshold": relevant_threshold,
     }])
     
-    out.to_csv(os.path.join(tables_dir, "relevance_analysis.csv"), index=False)
-    print(f"Wrote relevance analysis to {os.path.join(tables_dir, 'relevance_analysis.csv')}")
-    print(f"Summary: {len(scores)} items, {positive_score} positive scores ({positive_score/len(scores):.1%}), max score: {max_score:.2f}")
+    analysis_path = tables_dir / "relevance_analysis.csv"
+    out.to_csv(analysis_path, index=False)
+    print(f"Wrote relevance analysis to {analysis_path}")
+    print(f"Summary: {total_items} items, {positive_score} positive scores ({positive_score/total_items:.1%}), max score: {max_score:.2f}")
+
+
+def _relevant_labels(labels: pa.ChunkedArray) -> np.ndarray:
+    """Binary relevance of a string label column; empty labels are not relevant.
+
+    Labels are "1"/"true"/"True" (surrounding whitespace ignored), or numbers
+    when the whole column is numeric, in which case 1 (e.g. "1.0") is relevant.
+    """
+    trimmed = pc.utf8_trim_whitespace(labels)
+    try:
+        relevant = pc.equal(pc.cast(trimmed, pa.float64()), 1.0)
+    except pa.ArrowInvalid:
+        relevant = pc.is_in(trimmed, value_set=pa.array(["1", "true", "True"]))
+    return pc.fill_null(relevant, False).to_numpy(zero_copy_only=False)
+
+
+def _rank_labels(labels_path: Path) -> Optional[pd.DataFrame]:
+    """Parse labels.csv into binary relevance ranked by descending score (None if unlabeled)."""
+    if "label" not in pd.read_csv(labels_path, nrows=0).columns:
+        return None
+    # Only the ranking score and the label are needed; labels.csv also carries
+    # post text, which may span lines
+    table = pa_csv.read_csv(
+        labels_path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=["relevance_score", "label"],
+            column_types={"relevance_score": pa.float64(), "label": pa.string()},
+            strings_can_be_null=True,
+        ),
+    )
+    # Parse labels once into binary relevance, then rank by score
+    is_relevant = _relevant_labels(table["label"])
+    scores = table["relevance_score"].to_numpy()
+    order = pd.Series(scores).sort_values(ascending=False).index.to_numpy()
+    return pd.DataFrame({
+        "relevance_score": scores[order],
+        "is_relevant": is_relevant[order],
+    })
+
+
+def load_ranked_labels(labels_path: Union[str, Path]) -> Optional[pd.DataFrame]:
+    """Ranked labels from labels.feather, rebuilt from labels.csv whenever the CSV is newer.
+
+    Sweeping several k values then costs one memory-mapped read per run instead
+    of re-parsing, re-checking and re-sorting the CSV each time.
+    """
+    labels_path = Path(labels_path)
+    cache_path = labels_path.with_suffix(".feather")
+    try:
+        fresh = cache_path.stat().st_mtime >= labels_path.stat().st_mtime
+    except FileNotFoundError:
+        fresh = False
+    if fresh:
+        return pa_feather.read_table(cache_path, memory_map=True).to_pandas()
+    ranked = _rank_labels(labels_path)
+    if ranked is not None:
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        pa_feather.write_feather(ranked, tmp_path)
+        os.replace(tmp_path, cache_path)
+    return ranked
 
 
 def score_labels(out_dir: str, k: int) -> None:
-    labels_path = os.path.join(out_dir, "labels", "labels.csv")
-    tables_dir = os.path.join(out_dir, "tables")
-    os.makedirs(tables_dir, exist_ok=True)
-    if not os.path.exists(labels_path):
+    labels_path = Path(out_dir) / "labels" / "labels.csv"
+    tables_dir = Path(out_dir) / "tables"
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    if not labels_path.exists():
         print("labels.csv not found; run with --prepare_labels first.")
         print("Running automatic relevance analysis instead...")
         analyze_relevance_distribution(out_dir)
         return
-    df = pd.read_csv(labels_path)
-    if "label" not in df.columns:
+    ranked = load_ranked_labels(labels_path)
+    if ranked is None:
         print("No label column present.")
         return
-    df = df.sort_values("relevance_score", ascending=False)
-    df_k = df.head(k)
-    labels = [1 if str(x).strip() in {"1", "true", "True"} else 0 for x in df_k["label"].tolist()]
-    precision_at_k = sum(labels) / max(1, len(labels))
+    all_labels = ranked["is_relevant"].to_numpy(dtype=np.int8)
+    labels = all_labels[:k]
+    precision_at_k = labels.sum() / max(1, len(labels))
     ndcg_at_k = 0.0
-    if labels:
-        ideal = sorted(labels, reverse=True)
-        ndcg_at_k = dcg(labels) / max(dcg(ideal), 1e-9)
+    if len(labels):
+        # Gain is 2^rel - 1, which for binary labels is rel itself: DCG sums the
+        # reciprocal discounts at the relevant ranks, and the ideal ranking puts
+        # all m positives first, so its DCG is the sum of the first m (no sort
+        # of an ideal list needed)
+        gains_per_rank = 1.0 / _rank_discounts(len(labels))
+        ideal_dcg = gains_per_rank[:int(labels.sum())].sum()
+        ndcg_at_k = gains_per_rank[labels.astype(bool)].sum() / max(ideal_dcg, 1e-9)
 
     # harvest rate: fraction of labeled that are positive
-    all_labels = [1 if str(x).strip() in {"1", "true", "True"} else 0 for x in df["label"].tolist()]
-    harvest = (sum(all_labels) / max(1, len(all_labels))) if all_labels else 0.0
+    harvest = (all_labels.sum() / max(1, len(all_labels))) if len(all_labels) else 0.0
 
     out = pd.DataFrame(
         [
@@ -123,8 +256,9 @@ def score_labels(out_dir: str, k: int) -> None:
             }
         ]
     )
-    out.to_csv(os.path.join(tables_dir, "relevance_metrics.csv"), index=False)
-    print(f"Wrote relevance metrics to {os.path.join(tables_dir, 'relevance_metrics.csv')}")
+    metrics_path = tables_dir / "relevance_metrics.csv"
+    out.to_csv(metrics_path, index=False)
+    print(f"Wrote relevance metrics to {metrics_path}")
 
 
 def main():
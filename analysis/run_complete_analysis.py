@@ -3,35 +3,115 @@
 This script runs all analysis modules and generates a comprehensive report.
 """
 
+import argparse
 import os
 import sys
-import pandas as pd
-import matplotlib.pyplot as plt
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from pathlib import Path
 
 # Add analysis directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import analysis modules
-from author_activity import analyze_author_activity, plot_author_activity, print_author_insights
-from brand_topic_analysis import analyze_brand_mentions, plot_brand_topic_analysis, print_brand_topic_insights
-from network_analysis import create_discussion_network, analyze_network_structure, analyze_discussion_patterns, plot_network_analysis, print_network_insights
+# The analysis modules (and matplotlib) are imported inside the stages that
+# use them, so importing this module or skipping plots stays cheap
+from _materialize import load_edges, load_nodes
 
 warnings.filterwarnings('ignore')
 
-def create_output_directories():
+# Static parts of the summary report
+_REPORT_HEADER = (
+    "=" * 80,
+    "🚗 ELECTRIC VEHICLE DISCUSSION ANALYSIS - COMPREHENSIVE REPORT",
+    "=" * 80,
+)
+_REPORT_FOOTER = (
+    "",
+    "=" * 80,
+    "Report generated by EV Discussion Analysis Pipeline",
+    "=" * 80,
+)
+
+def create_output_directories(output_dir="analysis"):
     """Create necessary output directories."""
-    directories = ['analysis/results', 'analysis/plots']
-    for directory in directories:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Created directory: {directory}")
+    for directory in (Path(output_dir) / 'results', Path(output_dir) / 'plots'):
+        try:
+            directory.mkdir(parents=True)
+        except FileExistsError:
+            continue
+        print(f"Created directory: {directory}")
+
+def _setup_plotting():
+    """Select the non-interactive Agg backend (stages plot in worker processes)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.style.use('default')  # Reset style
+
+# Each _run_* stage computes one analysis and writes its results file and,
+# unless plots is False, its plot. They are top-level so a process pool can run
+# them; insights are printed by the caller so the console output stays in
+# stage order.
+
+def _run_author(nodes_file, edges_file, output_dir, plots=True):
+    """Author activity analysis, plot and CSV."""
+    from author_activity import analyze_author_activity, plot_author_activity
+    author_results = analyze_author_activity(nodes_file, edges_file)
+    
+    if plots:
+        _setup_plotting()
+        plot_author_activity(author_results, 
+                            save_path=f'{output_dir}/plots/author_activity_analysis.png')
+    
+    author_results['activity_summary_df'].sort_values('total_authored', ascending=False).to_csv(
+        f'{output_dir}/results/author_activity_results.csv', index=False)
+    return author_results
+
+def _run_brand(nodes_file, edges_file, output_dir, plots=True):
+    """Brand and topic analysis, plot and JSON."""
+    from brand_topic_analysis import analyze_brand_mentions, plot_brand_topic_analysis, save_brand_topic_results
+    brand_results = analyze_brand_mentions(nodes_file, edges_file)
+    
+    if plots:
+        _setup_plotting()
+        plot_brand_topic_analysis(brand_results, 
+                                 save_path=f'{output_dir}/plots/brand_topic_analysis.png')
+    
+    save_brand_topic_results(brand_results, f'{output_dir}/results/brand_topic_results.json')
+    return brand_results
+
+def _run_network(nodes_file, edges_file, output_dir, plots=True):
+    """Network structure and discussion pattern analyses, plot and JSON."""
+    from network_analysis import (
+        create_discussion_network, analyze_network_structure, analyze_discussion_patterns, plot_network_analysis,
+        save_network_results
+    )
+    # The discussion patterns need the frames too, so load them once here
+    nodes_df = load_nodes(nodes_file, columns=['node_id', 'node_type', 'attrs_json'])
+    edges_df = load_edges(edges_file, columns=['src_id', 'dst_id', 'edge_type', 'weight'])
+    graph = create_discussion_network(nodes_file, edges_file, nodes_df=nodes_df, edges_df=edges_df)
+    network_results = analyze_network_structure(graph)
+    discussion_results = analyze_discussion_patterns(graph, nodes_df, edges_df)
+    
+    if plots:
+        _setup_plotting()
+        plot_network_analysis(network_results, discussion_results,
+                             save_path=f'{output_dir}/plots/network_analysis.png')
+    
+    save_network_results(network_results, discussion_results,
+                         f'{output_dir}/results/network_analysis_results.json')
+    return {
+        'structure': network_results,
+        'discussion_patterns': discussion_results
+    }
 
 def run_complete_analysis(
     nodes_file="/Users/adityachaudhary/Desktop/SEMESTER_7/IKG/Crawler/data/processed/nodes.csv",
     edges_file="/Users/adityachaudhary/Desktop/SEMESTER_7/IKG/Crawler/data/processed/edges.csv",
     output_dir="analysis",
+    plots=True,
 ):
     """
     Run complete analysis pipeline for EV discussion data.
@@ -40,6 +120,7 @@ def run_complete_analysis(
         nodes_file: Path to nodes CSV file
         edges_file: Path to edges CSV file
         output_dir: Directory to save results
+        plots: Whether to render the plots (False never imports matplotlib)
     """
     
     print("\n" + "=" * 80)
@@ -56,37 +137,48 @@ def run_complete_analysis(
         return
     
     # Create output directories
-    create_output_directories()
+    create_output_directories(output_dir)
     
-    # Data overview
+    # Data overview. Loading through the Parquet caches also (re)builds them
+    # here, before the stages read them
     print(f"\n📊 DATA OVERVIEW:")
-    nodes_df = pd.read_csv(nodes_file)
-    edges_df = pd.read_csv(edges_file)
+    nodes_df = load_nodes(nodes_file, columns=['node_type'])
+    edges_df = load_edges(edges_file, columns=['edge_type'])
     print(f"  • Nodes: {len(nodes_df):,} ({nodes_df['node_type'].value_counts().to_dict()})")
     print(f"  • Edges: {len(edges_df):,} ({edges_df['edge_type'].value_counts().to_dict()})")
     
     results = {}
     
+    # The three stages only read the input data and are independent of each
+    # other, so run them (analysis, plot and saved results) concurrently; wall
+    # time is the slowest stage rather than the sum. Each worker is handed only
+    # the file paths and loads just the columns it reads from the Parquet
+    # caches, so no frames are pickled across processes. Errors surface from
+    # .result() inside each stage below.
+    print(f"\n\n⚙️ RUNNING ANALYSES IN PARALLEL...")
+    stages = {
+        'author_activity': _run_author,
+        'brand_topic': _run_brand,
+        'network': _run_network,
+    }
+    with ProcessPoolExecutor(max_workers=len(stages)) as executor:
+        futures = {
+            name: executor.submit(stage, nodes_file, edges_file, output_dir, plots=plots)
+            for name, stage in stages.items()
+        }
+    
     try:
         # 1. Author Activity Analysis
         print(f"\n\n👥 RUNNING AUTHOR ACTIVITY ANALYSIS...")
         print("-" * 50)
         
-        author_results = analyze_author_activity(nodes_file, edges_file)
+        from author_activity import print_author_insights
+        author_results = futures['author_activity'].result()
         results['author_activity'] = author_results
         
         # Print insights
         print_author_insights(author_results)
         
-        # Create visualizations
-        plt.style.use('default')  # Reset style
-        plot_author_activity(author_results, 
-                            save_path=f'{output_dir}/plots/author_activity_analysis.png')
-        
-        # Save detailed results
-        author_results['activity_summary_df'].to_csv(
-            f'{output_dir}/results/author_activity_results.csv', index=False)
-        
         print("✅ Author activity analysis completed!")
         
     except Exception as e:
@@ -98,23 +190,13 @@ def run_complete_analysis(
         print(f"\n\n🏷️ RUNNING BRAND & TOPIC ANALYSIS...")
         print("-" * 50)
         
-        brand_results = analyze_brand_mentions(nodes_file, edges_file)
+        from brand_topic_analysis import print_brand_topic_insights
+        brand_results = futures['brand_topic'].result()
         results['brand_topic'] = brand_results
         
         # Print insights
         print_brand_topic_insights(brand_results)
         
-        # Create visualizations
-        plt.style.use('default')  # Reset style
-        plot_brand_topic_analysis(brand_results, 
-                                 save_path=f'{output_dir}/plots/brand_topic_analysis.png')
-        
-        # Save results
-        import json
-        with open(f'{output_dir}/results/brand_topic_results.json', 'w') as f:
-            serializable_results = json.loads(json.dumps(brand_results, default=str))
-            json.dump(serializable_results, f, indent=2)
-        
         print("✅ Brand and topic analysis completed!")
         
     except Exception as e:
@@ -126,37 +208,13 @@ def run_complete_analysis(
         print(f"\n\n🕸️ RUNNING NETWORK ANALYSIS...")
         print("-" * 50)
         
-        # Create network
-        graph = create_discussion_network(nodes_file, edges_file)
-        
-        # Analyze network structure
-        network_results = analyze_network_structure(graph)
-        
-        # Analyze discussion patterns
-        discussion_results = analyze_discussion_patterns(graph, nodes_df, edges_df)
-        
-        results['network'] = {
-            'structure': network_results,
-            'discussion_patterns': discussion_results
-        }
+        # Network structure and discussion patterns
+        from network_analysis import print_network_insights
+        network = futures['network'].result()
+        results['network'] = network
         
         # Print insights
-        print_network_insights(network_results, discussion_results)
-        
-        # Create visualizations
-        plt.style.use('default')  # Reset style
-        plot_network_analysis(network_results, discussion_results,
-                             save_path=f'{output_dir}/plots/network_analysis.png')
-        
-        # Save results
-        combined_network_results = {
-            'network_structure': network_results,
-            'discussion_patterns': discussion_results
-        }
-        
-        with open(f'{output_dir}/results/network_analysis_results.json', 'w') as f:
-            serializable_results = json.loads(json.dumps(combined_network_results, default=str))
-            json.dump(serializable_results, f, indent=2)
+        print_network_insights(network['structure'], network['discussion_patterns'])
         
         print("✅ Network analysis completed!")
         
@@ -180,67 +238,65 @@ def run_complete_analysis(
     print("=" * 80)
     print(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\n📁 Results saved to: {output_dir}/results/")
-    print(f"🖼️ Plots saved to: {output_dir}/plots/")
+    if plots:
+        print(f"🖼️ Plots saved to: {output_dir}/plots/")
     
     print("\n📈 Generated files:")
-    result_files = [
-        f"{output_dir}/results/author_activity_results.csv",
-        f"{output_dir}/results/brand_topic_results.json",
-        f"{output_dir}/results/network_analysis_results.json",
-        f"{output_dir}/results/complete_analysis_summary.txt",
-        f"{output_dir}/plots/author_activity_analysis.png",
-        f"{output_dir}/plots/brand_topic_analysis.png",
-        f"{output_dir}/plots/network_analysis.png"
-    ]
-    
-    for file_path in result_files:
-        if os.path.exists(file_path):
-            print(f"  ✅ {file_path}")
-        else:
-            print(f"  ❌ {file_path} (not created)")
+    expected_files = {
+        Path(output_dir) / 'results': [
+            "author_activity_results.csv",
+            "brand_topic_results.json",
+            "network_analysis_results.json",
+            "complete_analysis_summary.txt",
+        ],
+    }
+    if plots:
+        expected_files[Path(output_dir) / 'plots'] = [
+            "author_activity_analysis.png",
+            "brand_topic_analysis.png",
+            "network_analysis.png"
+        ]
+    
+    # One directory listing per output directory instead of a stat per file
+    for directory, file_names in expected_files.items():
+        with os.scandir(directory) as entries:
+            present = {entry.name for entry in entries}
+        for file_name in file_names:
+            if file_name in present:
+                print(f"  ✅ {directory / file_name}")
+            else:
+                print(f"  ❌ {directory / file_name} (not created)")
     
     return results
 
-def generate_summary_report(results: dict, output_file: str = None):
-    """
-    Generate a comprehensive summary report of all analyses.
-    
-    Args:
-        results: Combined results from all analyses
-        output_file: Path to save the report
-    """
-    
-    report_lines = []
+def _summary_report_lines(results: dict):
+    """Yield the summary report one line at a time."""
     
     # Header
-    report_lines.extend([
-        "=" * 80,
-        "🚗 ELECTRIC VEHICLE DISCUSSION ANALYSIS - COMPREHENSIVE REPORT",
-        "=" * 80,
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-    ])
+    yield from _REPORT_HEADER
+    yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield ""
     
     # Executive Summary
-    report_lines.extend([
+    yield from [
         "📋 EXECUTIVE SUMMARY",
         "-" * 30,
-    ])
+    ]
     
     # Author Activity Summary
     if 'author_activity' in results and 'error' not in results['author_activity']:
         author_data = results['author_activity']
-        report_lines.extend([
+        yield from [
             f"\n👥 AUTHOR ACTIVITY:",
             f"  • Total Authors: {author_data['total_authors']:,}",
             f"  • Active Authors: {author_data['active_authors']:,}",
             f"  • Participation Rate: {author_data['active_authors']/author_data['total_authors']*100:.1f}%",
-        ])
+        ]
         
         if author_data['top_authors']:
             top_author = author_data['top_authors'][0]
             author_name = top_author['author_id'].split(':')[-1]
-            report_lines.append(
+            yield (
                 f"  • Most Active Author: {author_name} ({top_author['total_authored']} contributions)"
             )
     
@@ -248,16 +304,16 @@ def generate_summary_report(results: dict, output_file: str = None):
     if 'brand_topic' in results and 'error' not in results['brand_topic']:
         brand_data = results['brand_topic']
         data_summary = brand_data.get('data_summary', {})
-        report_lines.extend([
+        yield from [
             f"\n🏷️ BRAND & TOPIC ANALYSIS:",
             f"  • Total Posts: {data_summary.get('total_posts', 0):,}",
             f"  • Posts with Brand Mentions: {data_summary.get('posts_with_brand_mentions', 0):,}",
             f"  • Brand Mention Rate: {data_summary.get('brand_mention_rate', 0):.1f}%",
-        ])
+        ]
         
         domain_data = brand_data.get('domain_analysis', {})
         if domain_data:
-            report_lines.append(
+            yield (
                 f"  • Unique Domains Linked: {domain_data.get('unique_domains', 0):,}"
             )
     
@@ -268,32 +324,32 @@ def generate_summary_report(results: dict, output_file: str = None):
             basic_stats = network_data['structure'].get('basic_stats', {})
             components = network_data['structure'].get('components', {})
             
-            report_lines.extend([
+            yield from [
                 f"\n🕸️ NETWORK STRUCTURE:",
                 f"  • Total Nodes: {basic_stats.get('num_nodes', 0):,}",
                 f"  • Total Edges: {basic_stats.get('num_edges', 0):,}",
                 f"  • Network Density: {basic_stats.get('density', 0):.6f}",
                 f"  • Connected Components: {components.get('num_components', 0):,}",
                 f"  • Largest Component: {components.get('largest_component_size', 0):,} nodes",
-            ])
+            ]
         
         if 'discussion_patterns' in network_data:
             engage_data = network_data['discussion_patterns'].get('engagement_patterns', {})
             thread_data = network_data['discussion_patterns'].get('thread_analysis', {})
             
-            report_lines.extend([
+            yield from [
                 f"\n💬 DISCUSSION PATTERNS:",
                 f"  • Participation Rate: {engage_data.get('participation_rate', 0):.1f}%",
                 f"  • Average Thread Depth: {thread_data.get('avg_thread_depth', 0):.1f}",
                 f"  • Total Reply Chains: {thread_data.get('total_reply_chains', 0):,}",
-            ])
+            ]
     
     # Key Insights
-    report_lines.extend([
+    yield from [
         "",
         "💡 KEY INSIGHTS",
         "-" * 30,
-    ])
+    ]
     
     # Generate insights based on available data
     insights = []
@@ -328,7 +384,7 @@ def generate_summary_report(results: dict, output_file: str = None):
     
     # Add insights to report
     for insight in insights:
-        report_lines.append(f"  • {insight}")
+        yield f"  • {insight}"
     
     # Errors section
     errors = []
@@ -337,36 +393,44 @@ def generate_summary_report(results: dict, output_file: str = None):
             errors.append(f"  • {analysis_type.replace('_', ' ').title()}: {data['error']}")
     
     if errors:
-        report_lines.extend([
+        yield from [
             "",
             "⚠️ ANALYSIS ERRORS",
             "-" * 30,
-        ])
-        report_lines.extend(errors)
+        ]
+        yield from errors
     
     # Footer
-    report_lines.extend([
-        "",
-        "=" * 80,
-        "Report generated by EV Discussion Analysis Pipeline",
-        "=" * 80,
-    ])
+    yield from _REPORT_FOOTER
+
+def generate_summary_report(results: dict, output_file: str = None):
+    """
+    Generate a comprehensive summary report of all analyses.
     
-    # Join all lines
-    report_text = "\n".join(report_lines)
+    Each line is printed and written to output_file as it is produced, so the
+    report is never assembled in memory.
+    
+    Args:
+        results: Combined results from all analyses
+        output_file: Path to save the report
+    """
     
-    # Print to console
-    print(report_text)
+    with (open(output_file, 'w', encoding='utf-8') if output_file else nullcontext()) as f:
+        for line in _summary_report_lines(results):
+            print(line)
+            if f is not None:
+                print(line, file=f)
     
-    # Save to file if specified
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_text)
         print(f"\n✅ Summary report saved to: {output_file}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the complete EV discussion analysis pipeline")
+    parser.add_argument("--skip-plots", action="store_true", help="Compute and save results without plotting")
+    args = parser.parse_args()
+    
     # Run complete analysis pipeline
-    results = run_complete_analysis()
+    results = run_complete_analysis(plots=not args.skip_plots)
     
     if results:
         print(f"\n\n🎉 Analysis pipeline completed successfully!")
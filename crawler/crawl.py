@@ -4,15 +4,42 @@ from __future__ import annotations
 import argparse
 import os
 import time
-from typing import Dict  # kept for future extensibility but not strictly required
+from typing import Dict, List  # Dict kept for future extensibility
 
 from .frontier import Frontier
 from .parse import normalize_record
-from .persist import close_writers, open_writers, write_edge, write_metrics, write_node, write_post_jsonl
-from .relevance import content_score, final_priority, recency_boost
+from .persist import Writers, close_writers, flush_writers, open_writers, write_edge, write_metrics, write_node, write_post_jsonl
+from .relevance import content_score, final_priority, recency_boost, term_counts
 from .seeds import get_seeds, load_config
 from .utils import now_iso
 
+# Seconds between checkpoint flushes of the buffered output rows; the writers
+# are also flushed on close, including when the crawl is interrupted
+CHECKPOINT_SECONDS = 60.0
+
+
+def _write_mentions(
+    w: Writers,
+    src_id: str,
+    text: str,
+    brand_keys: List[str],
+    policy_keys: List[str],
+) -> None:
+    """Write MENTIONS_BRAND/MENTIONS_POLICY edges weighted by naive match counts."""
+    tl = text.lower()
+    for cnt in term_counts(tl, brand_keys):
+        if cnt > 0:
+            write_edge(w, src_id, "BRAND", "MENTIONS_BRAND", float(cnt), {})
+    for cnt in term_counts(tl, policy_keys):
+        if cnt > 0:
+            write_edge(w, src_id, "POLICY", "MENTIONS_POLICY", float(cnt), {})
+
+
+def _entry_key(entry):
+    """Frontier dedup key: the entry type plus its payload."""
+    etype, payload = entry
+    return etype, tuple(sorted(payload.items()))
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Focused crawler")
@@ -42,325 +69,330 @@ def run():
     policy_bonus = float(cfg.relevance.get("policy_bonus", 0.4))
 
     seeds = get_seeds(cfg)
-    brand_terms = cfg.domain.get("brands", [])
-    policy_terms = cfg.domain.get("policies", [])
-    keywords = cfg.domain.get("keywords", [])
+    # Tuples, so content_score's per-list caches are hit without copying
+    brand_terms = tuple(cfg.domain.get("brands", []))
+    policy_terms = tuple(cfg.domain.get("policies", []))
+    keywords = tuple(cfg.domain.get("keywords", []))
+    # Lowercased once; mention edges count each term in the lowercased text
+    brand_keys = [b.lower() for b in brand_terms]
+    policy_keys = [pterm.lower() for pterm in policy_terms]
 
     w = open_writers(out_dir)
-    fr = Frontier()
-
-    # Metrics
-    t0 = time.time()
-    success_calls = 0
-    error_calls = 0
-    items_fetched = 0
-    items_written = 0
-    dedup_skipped = 0
-    # last_call tracking not needed due to per-call qps sleeps inside fetchers
-
-    # Enqueue seeds (for reddit we enqueue search, for hn we enqueue list of stories)
-    if platform == "reddit":
-        from .fetch_reddit import make_client, search_submissions, fetch_comments, fetch_author_submissions
-
-        client = make_client(
-            cfg.reddit.get("client_id", ""),
-            cfg.reddit.get("client_secret", ""),
-            cfg.reddit.get("user_agent", ""),
-        )
-        if client is None:
-            print("Reddit client could not be initialized; exiting. Provide valid credentials.")
-            # Write a metrics row to satisfy acceptance even on failure
-            write_metrics(
-                w,
-                now_iso(),
-                items_fetched,
-                items_written,
-                time.time() - t0,
-                success_calls,
-                error_calls + 1,
-                dedup_skipped,
+    # Searches, comment threads, authors and submissions are each queued once
+    fr = Frontier(key=_entry_key)
+
+    try:
+        # Metrics
+        t0 = time.time()
+        last_checkpoint = time.monotonic()
+        success_calls = 0
+        error_calls = 0
+        items_fetched = 0
+        items_written = 0
+        dedup_skipped = 0
+        # last_call tracking not needed due to per-call qps sleeps inside fetchers
+
+        # Enqueue seeds (for reddit we enqueue search, for hn we enqueue list of stories)
+        if platform == "reddit":
+            from .fetch_reddit import make_client, search_submissions, fetch_comments, fetch_author_submissions
+
+            client = make_client(
+                cfg.reddit.get("client_id", ""),
+                cfg.reddit.get("client_secret", ""),
+                cfg.reddit.get("user_agent", ""),
             )
-            close_writers(w)
-            return
-
-        # Seed exploration: subreddit + keyword searches
-        for sub, kw in seeds:
-            fr.push(priority=1.0, item=("search", {"subreddit": sub, "query": kw}))
-
-        seen_posts: set[str] = set()
-
-        while len(fr) and items_written < max_items:
-            popped = fr.pop()
-            if not popped:
-                break
-            prio, entry = popped
-            etype, payload = entry
-
-            if etype == "search":
-                subreddit = payload["subreddit"]
-                query = payload["query"]
-                for s in search_submissions(client, subreddit, query, limit=50, qps=qps):
-                    items_fetched += 1
-                    success_calls += 1  # Successfully fetched a post from API
-                    try:
-                        post_id = s.id
-                        if post_id in seen_posts:
-                            dedup_skipped += 1
-                            continue
-                        seen_posts.add(post_id)
-                        created_utc = float(s.created_utc)
-                        title = s.title or ""
-                        body = s.selftext or ""
-                        text = (title + "\n" + body).strip()
-                        if len(text) < min_text_len:
+            if client is None:
+                print("Reddit client could not be initialized; exiting. Provide valid credentials.")
+                # Write a metrics row to satisfy acceptance even on failure
+                write_metrics(
+                    w,
+                    now_iso(),
+                    items_fetched,
+                    items_written,
+                    time.time() - t0,
+                    success_calls,
+                    error_calls + 1,
+                    dedup_skipped,
+                )
+                return
+
+            # Seed exploration: subreddit + keyword searches
+            for sub, kw in seeds:
+                fr.push(priority=1.0, item=("search", {"subreddit": sub, "query": kw}))
+
+            seen_posts: set[str] = set()
+
+            while len(fr) and items_written < max_items:
+                if time.monotonic() - last_checkpoint >= CHECKPOINT_SECONDS:
+                    flush_writers(w)
+                    last_checkpoint = time.monotonic()
+                popped = fr.pop()
+                if not popped:
+                    break
+                prio, entry = popped
+                etype, payload = entry
+
+                if etype == "search":
+                    subreddit = payload["subreddit"]
+                    query = payload["query"]
+                    for s in search_submissions(client, subreddit, query, limit=50, qps=qps):
+                        items_fetched += 1
+                        success_calls += 1  # Successfully fetched a post from API
+                        try:
+                            post_id = s.id
+                            if post_id in seen_posts:
+                                dedup_skipped += 1
+                                continue
+                            seen_posts.add(post_id)
+                            author = getattr(s, "author", None)
+                            created_utc = float(s.created_utc)
+                            title = s.title or ""
+                            body = s.selftext or ""
+                            text = (title + "\n" + body).strip()
+                            if len(text) < min_text_len:
+                                continue
+                            content = content_score(
+                                text, keywords=keywords, brand_terms=brand_terms, policy_terms=policy_terms,
+                                brand_bonus=brand_bonus, policy_bonus=policy_bonus
+                            )
+                            hours_since = (time.time() - created_utc) / 3600.0
+                            rec = recency_boost(hours_since, half_life)
+                            pr = final_priority(content, rec)
+
+                            if content >= tau_data:
+                                # write post
+                                record = normalize_record(
+                                    platform="reddit",
+                                    kind="post",
+                                    id=post_id,
+                                    author_id=str(getattr(author, "id", "")),
+                                    author_name=getattr(author, "name", ""),
+                                    container_id=subreddit,
+                                    container_name=subreddit,
+                                    created_utc=created_utc,
+                                    title=title,
+                                    body=body,
+                                    url=s.url or "",
+                                    score_upvotes=int(getattr(s, "score", 0) or 0),
+                                    num_comments=int(getattr(s, "num_comments", 0) or 0),
+                                    parent_id=None,
+                                    root_post_id=post_id,
+                                    depth=0,
+                                    relevance_score=float(content),
+                                    relevance_features={"content": content, "recency": rec, "priority": pr},
+                                    provenance={"endpoint": "reddit.search", "subreddit": subreddit, "query": query},
+                                )
+                                write_post_jsonl(w, record)
+                                items_written += 1
+                                # Graph nodes/edges
+                                write_node(w, node_id=f"reddit:post:{post_id}", node_type="post", attrs={"subreddit": subreddit})
+                                if author:
+                                    write_node(w, node_id=f"reddit:author:{record['author_name']}", node_type="author", attrs={})
+                                    write_edge(
+                                        w,
+                                        src_id=f"reddit:post:{post_id}",
+                                        dst_id=f"reddit:author:{record['author_name']}",
+                                        edge_type="AUTHORED_BY",
+                                    )
+                                write_node(w, node_id=f"reddit:container:{subreddit}", node_type="container", attrs={})
+                                write_edge(
+                                    w,
+                                    src_id=f"reddit:post:{post_id}",
+                                    dst_id=f"reddit:container:{subreddit}",
+                                    edge_type="IN_CONTAINER",
+                                )
+                                # Links to domains
+                                for d in record.get("outbound_domains", []):
+                                    write_node(w, node_id=f"domain:{d}", node_type="domain", attrs={})
+                                    write_edge(
+                                        w,
+                                        src_id=f"reddit:post:{post_id}",
+                                        dst_id=f"domain:{d}",
+                                        edge_type="LINKS_TO_DOMAIN",
+                                        weight=1.0,
+                                    )
+
+                                # Mentions brand/policy
+                                _write_mentions(
+                                    w, f"reddit:post:{post_id}", record["text"], brand_keys, policy_keys
+                                )
+
+                                # Enqueue comments and author recent posts
+                                fr.push(priority=pr, item=("comments", {"submission_id": post_id}))
+                                if author:
+                                    fr.push(priority=pr, item=("author", {"author": record["author_name"]}))
+
+                            elif pr >= tau_frontier:
+                                # Explore even if not admitted
+                                fr.push(priority=pr, item=("comments", {"submission_id": post_id}))
+                        except Exception:
+                            error_calls += 1
                             continue
-                        content = content_score(
-                            text, keywords=keywords, brand_terms=brand_terms, policy_terms=policy_terms,
-                            brand_bonus=brand_bonus, policy_bonus=policy_bonus
-                        )
-                        hours_since = (time.time() - created_utc) / 3600.0
-                        rec = recency_boost(hours_since, half_life)
-                        pr = final_priority(content, rec)
 
-                        if content >= tau_data:
-                            # write post
+                elif etype == "comments":
+                    sid = payload["submission_id"]
+                    for c in fetch_comments(client, sid, qps=qps):
+                        success_calls += 1  # Successfully fetched a comment from API
+                        try:
+                            body = getattr(c, "body", "") or ""
+                            if len(body.strip()) < min_text_len:
+                                continue
+                            cid = c.id
+                            author = getattr(c, "author", None)
+                            author_name = getattr(author, "name", "")
+                            parent_id = getattr(c, "parent_id", None)
                             record = normalize_record(
                                 platform="reddit",
-                                kind="post",
-                                id=post_id,
-                                author_id=str(getattr(s.author, "id", "")),
-                                author_name=getattr(s.author, "name", ""),
-                                container_id=subreddit,
-                                container_name=subreddit,
-                                created_utc=created_utc,
-                                title=title,
+                                kind="comment",
+                                id=cid,
+                                author_id=str(getattr(author, "id", "")),
+                                author_name=author_name,
+                                container_id=None,
+                                container_name=None,
+                                created_utc=float(getattr(c, "created_utc", time.time())),
+                                title="",
                                 body=body,
-                                url=s.url or "",
-                                score_upvotes=int(getattr(s, "score", 0) or 0),
-                                num_comments=int(getattr(s, "num_comments", 0) or 0),
-                                parent_id=None,
-                                root_post_id=post_id,
-                                depth=0,
-                                relevance_score=float(content),
-                                relevance_features={"content": content, "recency": rec, "priority": pr},
-                                provenance={"endpoint": "reddit.search", "subreddit": subreddit, "query": query},
+                                url="",
+                                score_upvotes=int(getattr(c, "score", 0) or 0),
+                                num_comments=None,
+                                parent_id=parent_id,
+                                root_post_id=sid,
+                                depth=int(getattr(c, "depth", 1)),
+                                relevance_score=0.0,
+                                relevance_features={},
+                                provenance={"endpoint": "reddit.comments", "submission_id": sid},
                             )
                             write_post_jsonl(w, record)
                             items_written += 1
-                            # Graph nodes/edges
-                            write_node(w, node_id=f"reddit:post:{post_id}", node_type="post", attrs={"subreddit": subreddit})
-                            if getattr(s, "author", None):
-                                write_node(w, node_id=f"reddit:author:{record['author_name']}", node_type="author", attrs={})
+                            # Graph: authored_by and reply_to
+                            if author_name:
+                                write_node(w, node_id=f"reddit:author:{author_name}", node_type="author", attrs={})
                                 write_edge(
                                     w,
-                                    src_id=f"reddit:post:{post_id}",
-                                    dst_id=f"reddit:author:{record['author_name']}",
+                                    src_id=f"reddit:comment:{cid}",
+                                    dst_id=f"reddit:author:{author_name}",
                                     edge_type="AUTHORED_BY",
                                 )
-                            write_node(w, node_id=f"reddit:container:{subreddit}", node_type="container", attrs={})
-                            write_edge(
-                                w,
-                                src_id=f"reddit:post:{post_id}",
-                                dst_id=f"reddit:container:{subreddit}",
-                                edge_type="IN_CONTAINER",
-                            )
-                            # Links to domains
-                            for d in record.get("outbound_domains", []):
-                                write_node(w, node_id=f"domain:{d}", node_type="domain", attrs={})
+                            # Create comment node as well
+                            write_node(w, node_id=f"reddit:comment:{cid}", node_type="comment", attrs={})
+                            if parent_id:
+                                # Map fullname to typed id
+                                dst = None
+                                if isinstance(parent_id, str) and parent_id.startswith("t3_"):
+                                    dst = f"reddit:post:{parent_id[3:]}"
+                                elif isinstance(parent_id, str) and parent_id.startswith("t1_"):
+                                    dst = f"reddit:comment:{parent_id[3:]}"
+                                else:
+                                    dst = f"reddit:{parent_id}"
                                 write_edge(
                                     w,
-                                    src_id=f"reddit:post:{post_id}",
-                                    dst_id=f"domain:{d}",
-                                    edge_type="LINKS_TO_DOMAIN",
-                                    weight=1.0,
+                                    src_id=f"reddit:comment:{cid}",
+                                    dst_id=dst,
+                                    edge_type="REPLY_TO",
                                 )
+                        except Exception:
+                            error_calls += 1
+                            continue
 
-                            # Mentions brand/policy
-                            # weight = naive match counts
-                            for b in brand_terms:
-                                cnt = record["text"].lower().count(b.lower())
-                                if cnt > 0:
-                                    write_edge(w, f"reddit:post:{post_id}", "BRAND", "MENTIONS_BRAND", float(cnt), {})
-                            for pterm in policy_terms:
-                                cnt = record["text"].lower().count(pterm.lower())
-                                if cnt > 0:
-                                    write_edge(w, f"reddit:post:{post_id}", "POLICY", "MENTIONS_POLICY", float(cnt), {})
-
-                            # Enqueue comments and author recent posts
-                            fr.push(priority=pr, item=("comments", {"submission_id": post_id}))
-                            if getattr(s, "author", None):
-                                fr.push(priority=pr, item=("author", {"author": record["author_name"]}))
-
-                        elif pr >= tau_frontier:
-                            # Explore even if not admitted
-                            fr.push(priority=pr, item=("comments", {"submission_id": post_id}))
-                    except Exception:
-                        error_calls += 1
-                        continue
+                elif etype == "author":
+                    name = payload["author"]
+                    for s in fetch_author_submissions(client, name, limit=25, qps=qps):
+                        success_calls += 1  # Successfully fetched author submission from API
+                        # Push back into search-like processing
+                        fr.push(priority=1.0, item=("submission", {"subreddit": str(getattr(s, "subreddit", "")), "id": s.id}))
 
-            elif etype == "comments":
-                sid = payload["submission_id"]
-                for c in fetch_comments(client, sid, qps=qps):
-                    success_calls += 1  # Successfully fetched a comment from API
-                    try:
-                        body = getattr(c, "body", "") or ""
-                        if len(body.strip()) < min_text_len:
-                            continue
-                        cid = c.id
-                        author_name = getattr(getattr(c, "author", None), "name", "")
-                        parent_id = getattr(c, "parent_id", None)
+                elif etype == "submission":
+                    sid = payload["id"]
+                    fr.push(priority=1.0, item=("comments", {"submission_id": sid}))
+
+        else:  # Hacker News fallback
+            from .fetch_hn import iter_recent_stories
+
+            for item in iter_recent_stories(limit=max(500, max_items * 5), qps=qps):
+                success_calls += 1  # Successfully fetched HN story from API
+                try:
+                    items_fetched += 1
+                    if item.get("type") != "story":
+                        continue
+                    title = item.get("title") or ""
+                    text = (item.get("text") or "").replace("<p>", "\n").replace("</p>", "")
+                    combined = (title + "\n" + text).strip() if title and text else (title or text)
+                    if len(combined) < min_text_len:
+                        continue
+                    content = content_score(
+                        combined, keywords=keywords, brand_terms=brand_terms, policy_terms=policy_terms,
+                        brand_bonus=brand_bonus, policy_bonus=policy_bonus
+                    )
+                    now = time.time()
+                    created_utc = float(item.get("time", now))
+                    hours_since = (now - created_utc) / 3600.0
+                    rec = recency_boost(hours_since, half_life)
+                    pr = final_priority(content, rec)
+
+                    if content >= tau_data or pr >= tau_frontier:
+                        # normalize and write
+                        post_id = str(item.get("id"))
+                        by = str(item.get("by", ""))
+                        url = item.get("url") or ""
                         record = normalize_record(
-                            platform="reddit",
-                            kind="comment",
-                            id=cid,
-                            author_id=str(getattr(getattr(c, "author", None), "id", "")),
-                            author_name=author_name,
-                            container_id=None,
-                            container_name=None,
-                            created_utc=float(getattr(c, "created_utc", time.time())),
-                            title="",
-                            body=body,
-                            url="",
-                            score_upvotes=int(getattr(c, "score", 0) or 0),
-                            num_comments=None,
-                            parent_id=parent_id,
-                            root_post_id=sid,
-                            depth=int(getattr(c, "depth", 1)),
-                            relevance_score=0.0,
-                            relevance_features={},
-                            provenance={"endpoint": "reddit.comments", "submission_id": sid},
+                            platform="hn",
+                            kind="post",
+                            id=post_id,
+                            author_id=by,
+                            author_name=by,
+                            container_id="hn",
+                            container_name="HackerNews",
+                            created_utc=created_utc,
+                            title=title,
+                            body=text,
+                            url=url,
+                            score_upvotes=int(item.get("score", 0) or 0),
+                            num_comments=int(item.get("descendants", 0) or 0),
+                            parent_id=None,
+                            root_post_id=post_id,
+                            depth=0,
+                            relevance_score=float(content),
+                            relevance_features={"content": content, "recency": rec, "priority": pr},
+                            provenance={"endpoint": "hn.newstories", "id": post_id},
                         )
                         write_post_jsonl(w, record)
                         items_written += 1
-                        # Graph: authored_by and reply_to
-                        if author_name:
-                            write_node(w, node_id=f"reddit:author:{author_name}", node_type="author", attrs={})
-                            write_edge(
-                                w,
-                                src_id=f"reddit:comment:{cid}",
-                                dst_id=f"reddit:author:{author_name}",
-                                edge_type="AUTHORED_BY",
-                            )
-                        # Create comment node as well
-                        write_node(w, node_id=f"reddit:comment:{cid}", node_type="comment", attrs={})
-                        if parent_id:
-                            # Map fullname to typed id
-                            dst = None
-                            if isinstance(parent_id, str) and parent_id.startswith("t3_"):
-                                dst = f"reddit:post:{parent_id[3:]}"
-                            elif isinstance(parent_id, str) and parent_id.startswith("t1_"):
-                                dst = f"reddit:comment:{parent_id[3:]}"
-                            else:
-                                dst = f"reddit:{parent_id}"
-                            write_edge(
-                                w,
-                                src_id=f"reddit:comment:{cid}",
-                                dst_id=dst,
-                                edge_type="REPLY_TO",
-                            )
-                    except Exception:
-                        error_calls += 1
-                        continue
 
-            elif etype == "author":
-                name = payload["author"]
-                for s in fetch_author_submissions(client, name, limit=25, qps=qps):
-                    success_calls += 1  # Successfully fetched author submission from API
-                    # Push back into search-like processing
-                    fr.push(priority=1.0, item=("submission", {"subreddit": str(getattr(s, "subreddit", "")), "id": s.id}))
-
-            elif etype == "submission":
-                sid = payload["id"]
-                fr.push(priority=1.0, item=("comments", {"submission_id": sid}))
-
-    else:  # Hacker News fallback
-        from .fetch_hn import iter_recent_stories
-
-        for item in iter_recent_stories(limit=max(500, max_items * 5), qps=qps):
-            success_calls += 1  # Successfully fetched HN story from API
-            try:
-                items_fetched += 1
-                if item.get("type") != "story":
-                    continue
-                title = item.get("title") or ""
-                text = (item.get("text") or "").replace("<p>", "\n").replace("</p>", "")
-                combined = (title + "\n" + text).strip() if title and text else (title or text)
-                if len(combined) < min_text_len:
+                        # Graph nodes/edges (no comments for HN in this minimal fallback)
+                        write_node(w, node_id=f"hn:post:{post_id}", node_type="post", attrs={})
+                        write_node(w, node_id=f"hn:author:{record['author_name']}", node_type="author", attrs={})
+                        write_edge(w, f"hn:post:{post_id}", f"hn:author:{record['author_name']}", "AUTHORED_BY", 1.0, {})
+                        write_node(w, node_id="hn:container:HN", node_type="container", attrs={})
+                        write_edge(w, f"hn:post:{post_id}", "hn:container:HN", "IN_CONTAINER", 1.0, {})
+                        for d in record.get("outbound_domains", []):
+                            write_node(w, node_id=f"domain:{d}", node_type="domain", attrs={})
+                            write_edge(w, f"hn:post:{post_id}", f"domain:{d}", "LINKS_TO_DOMAIN", 1.0, {})
+
+                        _write_mentions(w, f"hn:post:{post_id}", record["text"], brand_keys, policy_keys)
+                        if time.monotonic() - last_checkpoint >= CHECKPOINT_SECONDS:
+                            flush_writers(w)
+                            last_checkpoint = time.monotonic()
+
+                    if items_written >= max_items:
+                        break
+                except Exception:
+                    error_calls += 1
                     continue
-                content = content_score(
-                    combined, keywords=keywords, brand_terms=brand_terms, policy_terms=policy_terms,
-                    brand_bonus=brand_bonus, policy_bonus=policy_bonus
-                )
-                created_utc = float(item.get("time", time.time()))
-                hours_since = (time.time() - created_utc) / 3600.0
-                rec = recency_boost(hours_since, half_life)
-                pr = final_priority(content, rec)
-
-                if content >= tau_data or pr >= tau_frontier:
-                    # normalize and write
-                    post_id = str(item.get("id"))
-                    url = item.get("url") or ""
-                    record = normalize_record(
-                        platform="hn",
-                        kind="post",
-                        id=post_id,
-                        author_id=str(item.get("by", "")),
-                        author_name=str(item.get("by", "")),
-                        container_id="hn",
-                        container_name="HackerNews",
-                        created_utc=created_utc,
-                        title=title,
-                        body=text,
-                        url=url,
-                        score_upvotes=int(item.get("score", 0) or 0),
-                        num_comments=int(item.get("descendants", 0) or 0),
-                        parent_id=None,
-                        root_post_id=post_id,
-                        depth=0,
-                        relevance_score=float(content),
-                        relevance_features={"content": content, "recency": rec, "priority": pr},
-                        provenance={"endpoint": "hn.newstories", "id": post_id},
-                    )
-                    write_post_jsonl(w, record)
-                    items_written += 1
-
-                    # Graph nodes/edges (no comments for HN in this minimal fallback)
-                    write_node(w, node_id=f"hn:post:{post_id}", node_type="post", attrs={})
-                    write_node(w, node_id=f"hn:author:{record['author_name']}", node_type="author", attrs={})
-                    write_edge(w, f"hn:post:{post_id}", f"hn:author:{record['author_name']}", "AUTHORED_BY", 1.0, {})
-                    write_node(w, node_id="hn:container:HN", node_type="container", attrs={})
-                    write_edge(w, f"hn:post:{post_id}", "hn:container:HN", "IN_CONTAINER", 1.0, {})
-                    for d in record.get("outbound_domains", []):
-                        write_node(w, node_id=f"domain:{d}", node_type="domain", attrs={})
-                        write_edge(w, f"hn:post:{post_id}", f"domain:{d}", "LINKS_TO_DOMAIN", 1.0, {})
-
-                    for b in brand_terms:
-                        cnt = record["text"].lower().count(b.lower())
-                        if cnt > 0:
-                            write_edge(w, f"hn:post:{post_id}", "BRAND", "MENTIONS_BRAND", float(cnt), {})
-                    for pterm in policy_terms:
-                        cnt = record["text"].lower().count(pterm.lower())
-                        if cnt > 0:
-                            write_edge(w, f"hn:post:{post_id}", "POLICY", "MENTIONS_POLICY", float(cnt), {})
-
-                if items_written >= max_items:
-                    break
-            except Exception:
-                error_calls += 1
-                continue
-
-    # Always write metrics at end
-    write_metrics(
-        w,
-        now_iso(),
-        items_fetched,
-        items_written,
-        time.time() - t0,
-        success_calls,
-        error_calls,
-        dedup_skipped,
-    )
-    close_writers(w)
+
+        # Always write metrics at end
+        write_metrics(
+            w,
+            now_iso(),
+            items_fetched,
+            items_written,
+            time.time() - t0,
+            success_calls,
+            error_calls,
+            dedup_skipped,
+        )
+    finally:
+        # Flush buffered rows even if the crawl is interrupted
+        close_writers(w)
     print(f"Done. Wrote {items_written} items to {w.posts_path} and graph CSVs to {os.path.dirname(w.nodes_path)}")
 
 
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, List, Optional, cast
 
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from .utils import sleep_for_qps
+from .utils import RateLimiter, sleep_for_qps
 
 BASE = "https://hacker-news.firebaseio.com/v0"
 
@@ -42,14 +44,40 @@ def fetch_item(item_id: int, qps: float) -> Optional[dict]:
         return None
 
 
-def iter_recent_stories(limit: int, qps: float) -> Iterable[dict]:
-    """Yield recent story items (type=story) up to limit."""
+def iter_recent_stories(limit: int, qps: float, concurrency: int = 8) -> Iterable[dict]:
+    """Yield recent story items (type=story) up to limit.
+
+    Items are fetched by up to `concurrency` threads so request latency
+    overlaps, while a shared limiter keeps request starts at no more than qps.
+    Stories are yielded in newstories order.
+    """
+    ids = fetch_new_story_ids(qps)
+    limiter = RateLimiter(qps)
+    concurrency = max(1, concurrency)
+
+    def load(item_id: int) -> Optional[dict]:
+        limiter.wait()
+        try:
+            return _get_json(f"{BASE}/item/{item_id}.json")
+        except Exception:
+            return None
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending: deque = deque()
+    next_id = 0
     count = 0
-    for iid in fetch_new_story_ids(qps):
-        if count >= limit:
-            break
-        item = fetch_item(iid, qps)
-        if not item or item.get("type") != "story":
-            continue
-        yield item
-        count += 1
+    try:
+        while count < limit:
+            # Keep a bounded window of requests in flight ahead of the consumer
+            while next_id < len(ids) and len(pending) < concurrency:
+                pending.append(pool.submit(load, ids[next_id]))
+                next_id += 1
+            if not pending:
+                break
+            item = pending.popleft().result()
+            if not item or item.get("type") != "story":
+                continue
+            yield item
+            count += 1
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,12 +1,18 @@
 """Reddit fetchers using PRAW (requires credentials in config)."""
 from __future__ import annotations
 
-import time
+from functools import lru_cache
 from typing import Optional
 
 import praw
 
-from .utils import sleep_for_qps
+from .utils import RateLimiter
+
+
+@lru_cache(maxsize=None)
+def _limiter(qps: float) -> RateLimiter:
+    """Limiter shared by all fetchers at this qps, so items stay spaced across calls."""
+    return RateLimiter(qps)
 
 
 def make_client(client_id: str, client_secret: str, user_agent: str) -> Optional[praw.Reddit]:
@@ -33,10 +39,11 @@ def search_submissions(
 ):
     """Yield submissions from a subreddit search sorted by new."""
     try:
+        limiter = _limiter(qps)
         sub = reddit.subreddit(subreddit)
         it = sub.search(query=query, sort="new", time_filter="year", limit=limit)
         for s in it:
-            sleep_for_qps(qps, time.time())
+            limiter.wait()
             yield s
     except Exception:
         return
@@ -44,10 +51,11 @@ def search_submissions(
 
 def fetch_comments(reddit: praw.Reddit, submission_id: str, qps: float):
     try:
+        limiter = _limiter(qps)
         s = reddit.submission(id=submission_id)
         s.comments.replace_more(limit=0)
         for c in s.comments.list():
-            sleep_for_qps(qps, time.time())
+            limiter.wait()
             yield c
     except Exception:
         return
@@ -55,9 +63,10 @@ def fetch_comments(reddit: praw.Reddit, submission_id: str, qps: float):
 
 def fetch_author_submissions(reddit: praw.Reddit, author_name: str, limit: int, qps: float):
     try:
+        limiter = _limiter(qps)
         redditor = reddit.redditor(author_name)
         for s in redditor.submissions.new(limit=limit):
-            sleep_for_qps(qps, time.time())
+            limiter.wait()
             yield s
     except Exception:
         return
@@ -2,24 +2,28 @@
 from __future__ import annotations
 
 import heapq
-from dataclasses import dataclass, field
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
-
-@dataclass(order=True)
-class _PQItem:
-    priority: float
-    seq: int
-    item: Any = field(compare=False)
+# Heap entries are (-priority, seq, item, key) tuples. seq is unique, so tuple
+# comparison never reaches item or key.
+_PQEntry = Tuple[float, int, Any, Any]
 
 
 class Frontier:
-    """A max-heap frontier with dedup by a provided key function."""
+    """A max-heap frontier with dedup by a provided key function.
+
+    With ``key``, an item whose key was already pushed is dropped, unless it is
+    still queued and the new priority is higher; then the queued entry is
+    tombstoned (skipped lazily on pop) and the item is re-queued.
+    """
 
-    def __init__(self):
-        self._heap: list[_PQItem] = []
+    def __init__(self, key: Optional[Callable[[Any], Hashable]] = None):
+        self._heap: list[_PQEntry] = []
         self._seq = 0
-        self._seen: set[str] = set()
+        self._seen: set = set()
+        self._key = key
+        self._queued: Dict[Hashable, Tuple[float, int]] = {}  # key -> (priority, seq) of live entry
+        self._tombstones: set[int] = set()
 
     def seen(self, key: str) -> bool:
         return key in self._seen
@@ -28,15 +32,32 @@ class Frontier:
         self._seen.add(key)
 
     def push(self, priority: float, item: Any) -> None:
+        k = None
+        if self._key is not None:
+            k = self._key(item)
+            queued = self._queued.get(k)
+            if queued is not None:
+                if priority <= queued[0]:
+                    return
+                self._tombstones.add(queued[1])
+            elif k in self._seen:
+                return
+            self._seen.add(k)
+            self._queued[k] = (priority, self._seq)
         # heapq is min-heap; use negative to simulate max-heap
-        heapq.heappush(self._heap, _PQItem(priority=-priority, seq=self._seq, item=item))
+        heapq.heappush(self._heap, (-priority, self._seq, item, k))
         self._seq += 1
 
     def pop(self) -> Optional[Tuple[float, Any]]:
-        if not self._heap:
-            return None
-        node = heapq.heappop(self._heap)
-        return -node.priority, node.item
-
-    def __len__(self) -> int:  # for truthiness and metrics
-        return len(self._heap)
+        while self._heap:
+            neg_priority, seq, item, k = heapq.heappop(self._heap)
+            if seq in self._tombstones:
+                self._tombstones.discard(seq)
+                continue
+            if self._key is not None:
+                del self._queued[k]
+            return -neg_priority, item
+        return None
+
+    def __len__(self) -> int:  # for truthiness and metrics; counts live entries only
+        return len(self._heap) - len(self._tombstones)
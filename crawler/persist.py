@@ -3,11 +3,20 @@ from __future__ import annotations
 
 import csv
 import os
-from dataclasses import dataclass
-from typing import Any, TextIO
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, List, Set, TextIO
+
+import orjson
 
 from .utils import json_dumps
 
+# Rows buffered per output file before they are written in one call
+FLUSH_N = 1000
+# Write buffer of the binary posts.jsonl handle
+POSTS_BUFFER_SIZE = 1 << 20
+# json_dumps({}); most nodes and edges carry no attributes
+EMPTY_ATTRS_JSON = "{}"
+
 
 @dataclass
 class Writers:
@@ -16,7 +25,7 @@ class Writers:
     edges_path: str
     metrics_path: str
 
-    posts_fh: TextIO
+    posts_fh: BinaryIO
     nodes_fh: TextIO
     edges_fh: TextIO
     metrics_fh: TextIO
@@ -24,6 +33,13 @@ class Writers:
     edges_writer: Any
     metrics_writer: Any
 
+    # Pending rows, written FLUSH_N at a time and on close
+    posts_buf: List[bytes] = field(default_factory=list)
+    nodes_buf: List[list] = field(default_factory=list)
+    edges_buf: List[list] = field(default_factory=list)
+    # node_ids already written; nodes.csv holds each node once
+    emitted_nodes: Set[str] = field(default_factory=set)
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
@@ -43,7 +59,7 @@ def open_writers(out_dir: str) -> Writers:
     edges_path = os.path.join(out_dir, "edges.csv")
     metrics_path = os.path.join(out_dir, "metrics.csv")
 
-    posts_fh = open(posts_path, "a", encoding="utf-8")
+    posts_fh = open(posts_path, "ab", buffering=POSTS_BUFFER_SIZE)
     nodes_fh = open(nodes_path, "w", newline="", encoding="utf-8")
     edges_fh = open(edges_path, "w", newline="", encoding="utf-8")
     metrics_fh = open(metrics_path, "a", newline="", encoding="utf-8")
@@ -85,7 +101,33 @@ def open_writers(out_dir: str) -> Writers:
     )
 
 
+def _flush_posts(w: Writers) -> None:
+    w.posts_fh.write(b"".join(w.posts_buf))
+    w.posts_buf.clear()
+
+
+def _flush_nodes(w: Writers) -> None:
+    w.nodes_writer.writerows(w.nodes_buf)
+    w.nodes_buf.clear()
+
+
+def _flush_edges(w: Writers) -> None:
+    w.edges_writer.writerows(w.edges_buf)
+    w.edges_buf.clear()
+
+
+def flush_writers(w: Writers) -> None:
+    """Write out all buffered posts, nodes and edges and flush them to the OS."""
+    _flush_posts(w)
+    _flush_nodes(w)
+    _flush_edges(w)
+    w.posts_fh.flush()
+    w.nodes_fh.flush()
+    w.edges_fh.flush()
+
+
 def close_writers(w: Writers) -> None:
+    flush_writers(w)
     w.posts_fh.close()
     w.nodes_fh.close()
     w.edges_fh.close()
@@ -93,18 +135,31 @@ def close_writers(w: Writers) -> None:
 
 
 def write_post_jsonl(w: Writers, record: dict) -> None:
-    line = json_dumps(record)
-    w.posts_fh.write(line + "\n")
+    # orjson encodes straight to UTF-8 bytes, newline included
+    w.posts_buf.append(orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
+    if len(w.posts_buf) >= FLUSH_N:
+        _flush_posts(w)
 
 
 def write_node(w: Writers, node_id: str, node_type: str, attrs: dict | None = None) -> None:
-    w.nodes_writer.writerow([node_id, node_type, json_dumps(attrs or {})])
+    """Buffer a node row; nodes already written in this run are skipped."""
+    emitted = w.emitted_nodes
+    if node_id in emitted:
+        return
+    emitted.add(node_id)
+    buf = w.nodes_buf
+    buf.append([node_id, node_type, json_dumps(attrs) if attrs else EMPTY_ATTRS_JSON])
+    if len(buf) >= FLUSH_N:
+        _flush_nodes(w)
 
 
 def write_edge(
     w: Writers, src_id: str, dst_id: str, edge_type: str, weight: float = 1.0, attrs: dict | None = None
 ) -> None:
-    w.edges_writer.writerow([src_id, dst_id, edge_type, weight, json_dumps(attrs or {})])
+    buf = w.edges_buf
+    buf.append([src_id, dst_id, edge_type, weight, json_dumps(attrs) if attrs else EMPTY_ATTRS_JSON])
+    if len(buf) >= FLUSH_N:
+        _flush_edges(w)
 
 
 def write_metrics(
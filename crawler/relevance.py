@@ -4,29 +4,44 @@ Provides:
 - content_score: lexical hits + phrase/brand/policy bonuses
 - recency_boost: exponential decay based on half-life (hours)
 - final_priority: combine scores into a single priority value
+- term_counts: per-term occurrence counts for brand/policy mention edges
 """
 from __future__ import annotations
 
 import math
 import re
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_+-]+")
 
 
 def _tokenize(text: str) -> List[str]:
-    return re.findall(r"[A-Za-z0-9_+-]+", text.lower()) if text else []
+    return _TOKEN_RE.findall(text.lower()) if text else []
 
 
 def _phrase_hits(text: str, phrases: Iterable[str]) -> int:
     if not text:
         return 0
-    tl = text.lower()
-    c = 0
-    for ph in phrases:
-        phl = ph.lower().strip()
-        if not phl:
-            continue
-        c += tl.count(phl)
-    return c
+    return _lower_phrase_hits(text.lower(), phrases)
+
+
+@lru_cache(maxsize=64)
+def _keyword_tokens(keywords: Tuple[str, ...]) -> frozenset:
+    """Union of the keywords' tokens; computed once per keyword list."""
+    return frozenset(tok for kw in keywords for tok in _tokenize(kw))
+
+
+@lru_cache(maxsize=64)
+def _lowered_phrases(phrases: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercased, stripped, non-empty phrases; computed once per phrase list."""
+    return tuple(phl for phl in (ph.lower().strip() for ph in phrases) if phl)
+
+
+def _lower_phrase_hits(tl: str, phrases: Iterable[str]) -> int:
+    # tl is already lowercased; each phrase is counted by str.count's C scan
+    return sum(map(tl.count, _lowered_phrases(tuple(phrases))))
 
 
 def content_score(
@@ -44,20 +59,31 @@ def content_score(
     """
     if not text:
         return 0.0
-    toks = _tokenize(text)
-    tokset = set(toks)
-    key_tokens = set()
-    for kw in keywords:
-        key_tokens.update(_tokenize(kw))
-    base = 0.2 * len(tokset & key_tokens)
-    base += 0.6 * _phrase_hits(text, keywords)
-
-    brand_hits = _phrase_hits(text, brand_terms)
-    policy_hits = _phrase_hits(text, policy_terms)
+    # Lowercase once for the tokens and all three phrase counts
+    tl = text.lower()
+    keywords = tuple(keywords)
+    # Unique text tokens that are keyword tokens; probing the small keyword set
+    # with the token list avoids building a set of every token in the text
+    base = 0.2 * len(_keyword_tokens(keywords).intersection(_TOKEN_RE.findall(tl)))
+    base += 0.6 * _lower_phrase_hits(tl, keywords)
+
+    brand_hits = _lower_phrase_hits(tl, brand_terms)
+    policy_hits = _lower_phrase_hits(tl, policy_terms)
     bonus = brand_hits * brand_bonus + policy_hits * policy_bonus
     return base + bonus
 
 
+def term_counts(text_lower: str, terms_lower: Sequence[str]) -> List[int]:
+    """Occurrences of each lowercased term in lowercased text, one str.count per term.
+
+    Nested and overlapping terms are each counted on their own (a text with
+    "model 3" counts for both "model" and "model 3"), as in content_score. For
+    the handful of configured terms these C-level scans beat a single-pass
+    automaton written in Python.
+    """
+    return [text_lower.count(t) for t in terms_lower]
+
+
 def recency_boost(hours_since: float, half_life_hours: float = 72.0) -> float:
     """Exponential half-life decay boost. Returns in (0, 1]."""
     if hours_since <= 0:
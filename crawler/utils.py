@@ -6,13 +6,16 @@ simple sentence span detection.
 from __future__ import annotations
 
 import hashlib
-import json
 import re
+import threading
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import langid
+import numpy as np
+import orjson
 import tldextract
 from dateutil import parser as dateparser
 
@@ -42,13 +45,24 @@ def to_iso(ts: float | int | str) -> str:
     raise TypeError("Unsupported timestamp type")
 
 
+@lru_cache(maxsize=1)
+def _lang_identifier() -> langid.langid.LanguageIdentifier:
+    """langid's bundled model, loaded on first use (as langid.classify does)."""
+    return langid.langid.LanguageIdentifier.from_modelstring(langid.langid.model)
+
+
 def detect_lang(text: str) -> str:
     """Detect language code using langid; return 'en' fallback on errors."""
     if not text:
         return ""
     try:
-        code, _ = langid.classify(text)
-        return code
+        ident = _lang_identifier()
+        fv = ident.instance2fv(text)
+        # Same naive Bayes argmax as langid.classify, but only over the features
+        # present in the text, so the whole model matrix isn't multiplied each call
+        nz = np.flatnonzero(fv)
+        log_probs = fv[nz].astype(np.float64) @ ident.nb_ptc[nz] + ident.nb_pc
+        return str(ident.nb_classes[int(np.argmax(log_probs))])
     except Exception:
         return ""
 
@@ -66,12 +80,21 @@ def extract_urls(text: str) -> List[str]:
     return _URL_RE.findall(text)
 
 
+# Uses the Public Suffix List snapshot bundled with tldextract: no download on
+# first use and no on-disk cache, so domains don't depend on network access
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=65536)
 def url_to_domain(url: str) -> Optional[str]:
-    """Extract registrable domain using tldextract; returns None if unavailable."""
+    """Extract registrable domain using tldextract; returns None if unavailable.
+
+    Memoized: the same links (and link domains) recur across many records.
+    """
     if not url:
         return None
     try:
-        ext = tldextract.extract(url)
+        ext = _TLD_EXTRACT(url)
         if not ext.domain:
             return None
         domain = ".".join(p for p in [ext.domain, ext.suffix] if p)
@@ -82,13 +105,9 @@ def url_to_domain(url: str) -> Optional[str]:
 
 def sha1_hash(*parts: str) -> str:
     """Stable SHA1 hash from provided string parts."""
-    h = hashlib.sha1()
-    for p in parts:
-        if p is None:
-            continue
-        h.update(p.encode("utf-8", errors="ignore"))
-        h.update(b"|")
-    return h.hexdigest()
+    # One encode + one update over "p1|p2|...|"; same digest as hashing per part
+    joined = "".join(p + "|" for p in parts if p is not None)
+    return hashlib.sha1(joined.encode("utf-8", errors="ignore")).hexdigest()
 
 
 def sleep_for_qps(qps: float, last_time: Optional[float]) -> float:
@@ -104,33 +123,44 @@ def sleep_for_qps(qps: float, last_time: Optional[float]) -> float:
     return time.time()
 
 
+class RateLimiter:
+    """Spaces calls to wait() at least 1/qps apart, across all threads sharing it.
+
+    Uses time.monotonic() deadlines: a call returns immediately when its slot
+    has already passed, so time spent between calls counts toward the interval.
+    """
+
+    def __init__(self, qps: float):
+        self._interval = 1.0 / qps if qps > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# A sentence runs up to and including '.', '!' or '?' (or is the unterminated
+# tail); whitespace around it is matched outside group 1, which is the trimmed span
+_SENT_RE = re.compile(r"\s*([^.!?]*[.!?]|[^.!?]*[^.!?\s])\s*")
+
+
 def sentence_spans(text: str) -> List[Tuple[int, int]]:
     """Very simple sentence segmentation returning (start, end) offsets.
 
     Splits on '.', '!', '?'. Trims whitespace. Returns non-empty spans.
     """
-    spans: List[Tuple[int, int]] = []
-    if not text:
-        return spans
-    start = 0
-    for m in re.finditer(r"[.!?]", text):
-        end = m.end()
-        seg = text[start:end]
-        if seg.strip():
-            # Trim leading/trailing whitespace to compute exact offsets
-            ltrim = len(seg) - len(seg.lstrip())
-            rtrim = len(seg) - len(seg.rstrip())
-            spans.append((start + ltrim, end - rtrim))
-        start = end
-    if start < len(text):
-        seg = text[start:]
-        if seg.strip():
-            ltrim = len(seg) - len(seg.lstrip())
-            rtrim = len(seg) - len(seg.rstrip())
-            spans.append((start + ltrim, len(text) - rtrim))
-    return spans
+    if not text or text.isspace():
+        return []
+    return [m.span(1) for m in _SENT_RE.finditer(text)]
 
 
 def json_dumps(data: dict) -> str:
-    """Stable JSON dumps for attributes in graph CSVs."""
-    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+    """Stable JSON dumps for attributes in graph CSVs (sorted keys, compact, UTF-8)."""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
@@ -5,9 +5,13 @@ Performs systematic evaluation on a sample of posts with calculated metrics.
 
 import json
 import random
+from collections import Counter
 from pathlib import Path
 import sys
 
+import numpy as np
+import orjson
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ner.entity_extractor import EntityExtractor
@@ -24,19 +28,29 @@ from evaluation.metrics import (
 
 def load_sample_posts(data_file: Path, sample_size: int = 50, seed: int = 42) -> list:
     """Load a random sample of posts for evaluation."""
-    posts = []
-    with open(data_file, 'r', encoding='utf-8') as f:
+    # First pass keeps only the byte offsets of eligible posts
+    offsets = []
+    with open(data_file, 'rb') as f:
+        offset = 0
         for line in f:
             try:
-                post = json.loads(line)
+                post = orjson.loads(line)
                 if post.get('text') and len(post['text']) > 20:
-                    posts.append(post)
-            except json.JSONDecodeError:
-                continue
+                    offsets.append(offset)
+            except orjson.JSONDecodeError:
+                pass
+            offset += len(line)
     
-    # Random sample
+    # Random sample (same draw as sampling the posts themselves)
     random.seed(seed)
-    sample = random.sample(posts, min(sample_size, len(posts)))
+    sample_offsets = random.sample(offsets, min(sample_size, len(offsets)))
+    
+    # Second pass: seek to and parse just the sampled posts
+    sample = []
+    with open(data_file, 'rb') as f:
+        for offset in sample_offsets:
+            f.seek(offset)
+            sample.append(orjson.loads(f.readline()))
     return sample
 
 
@@ -289,32 +303,22 @@ def analyze_kg_quality(kg_file: Path) -> dict:
     edges = kg_data['edges']
     
     # Calculate additional metrics
-    node_degree_dist = {}
-    for node in nodes:
-        node_id = node['id']
-        # Count edges
-        out_degree = sum(1 for e in edges if e['source'] == node_id)
-        in_degree = sum(1 for e in edges if e['target'] == node_id)
-        total_degree = out_degree + in_degree
-        
-        if total_degree not in node_degree_dist:
-            node_degree_dist[total_degree] = 0
-        node_degree_dist[total_degree] += 1
+    # Degrees in one pass over the edges (out + in; a self-loop counts twice)
+    degree = Counter()
+    for e in edges:
+        degree[e['source']] += 1
+        degree[e['target']] += 1
+    node_degree_dist = dict(Counter(degree[node['id']] for node in nodes))
     
     # Calculate confidence statistics
-    entity_confidences = [node['confidence'] for node in nodes]
-    relation_confidences = [edge['confidence'] for edge in edges]
+    entity_confidences = np.fromiter((node['confidence'] for node in nodes), dtype=np.float64, count=len(nodes))
+    relation_confidences = np.fromiter((edge['confidence'] for edge in edges), dtype=np.float64, count=len(edges))
     
-    avg_entity_conf = sum(entity_confidences) / len(entity_confidences) if entity_confidences else 0
-    avg_relation_conf = sum(relation_confidences) / len(relation_confidences) if relation_confidences else 0
+    avg_entity_conf = float(entity_confidences.mean()) if entity_confidences.size else 0
+    avg_relation_conf = float(relation_confidences.mean()) if relation_confidences.size else 0
     
     # Entity frequency distribution
-    entity_freq_dist = {}
-    for node in nodes:
-        freq = node['frequency']
-        if freq not in entity_freq_dist:
-            entity_freq_dist[freq] = 0
-        entity_freq_dist[freq] += 1
+    entity_freq_dist = dict(Counter(node['frequency'] for node in nodes))
     
     return {
         'num_nodes': stats['num_nodes'],
@@ -0,0 +1,72 @@
+import unittest
+
+from crawler.frontier import Frontier
+
+
+def _drain(frontier):
+    out = []
+    while True:
+        popped = frontier.pop()
+        if popped is None:
+            return out
+        out.append(popped)
+
+
+class TestFrontier(unittest.TestCase):
+    def test_pops_highest_priority_first(self):
+        f = Frontier()
+        f.push(0.5, "b")
+        f.push(2.0, "a")
+        f.push(0.1, "c")
+        self.assertEqual(_drain(f), [(2.0, "a"), (0.5, "b"), (0.1, "c")])
+
+    def test_higher_priority_repush_replaces_queued_entry(self):
+        f = Frontier(key=lambda item: item["id"])
+        f.push(1.0, {"id": "x", "v": 1})
+        f.push(0.5, {"id": "y", "v": 1})
+        f.push(3.0, {"id": "x", "v": 2})
+        self.assertEqual(_drain(f), [(3.0, {"id": "x", "v": 2}), (0.5, {"id": "y", "v": 1})])
+
+    def test_lower_or_equal_priority_repush_is_dropped(self):
+        f = Frontier(key=lambda item: item[0])
+        f.push(2.0, ("x", 1))
+        f.push(2.0, ("x", 2))
+        f.push(1.0, ("x", 3))
+        self.assertEqual(len(f), 1)
+        self.assertEqual(_drain(f), [(2.0, ("x", 1))])
+
+    def test_len_counts_live_entries_only(self):
+        f = Frontier(key=lambda item: item)
+        f.push(1.0, "x")
+        f.push(1.0, "y")
+        f.push(2.0, "x")
+        f.push(3.0, "x")
+        self.assertEqual(len(f), 2)
+        f.pop()
+        self.assertEqual(len(f), 1)
+        f.pop()
+        self.assertEqual(len(f), 0)
+        self.assertFalse(f)
+
+    def test_pop_skips_tombstones(self):
+        f = Frontier(key=lambda item: item)
+        f.push(5.0, "x")
+        f.push(1.0, "y")
+        f.push(6.0, "x")
+        self.assertEqual(f.pop(), (6.0, "x"))
+        # The superseded (5.0, "x") entry is still on the heap but must not surface
+        self.assertEqual(f.pop(), (1.0, "y"))
+        self.assertIsNone(f.pop())
+        self.assertEqual(len(f), 0)
+
+    def test_popped_key_is_not_requeued(self):
+        f = Frontier(key=lambda item: item)
+        f.push(1.0, "x")
+        f.pop()
+        f.push(9.0, "x")
+        self.assertEqual(len(f), 0)
+        self.assertIsNone(f.pop())
+
+
+if __name__ == "__main__":
+    unittest.main()
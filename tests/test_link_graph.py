@@ -0,0 +1,92 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from networkx.algorithms import bipartite
+
+from analysis.link_graph import author_adjacency, container_projection, hits_sparse, pagerank_sparse
+
+
+def _reply_graph():
+    """Small weighted author graph; "e" only receives replies (dangling) and "f" is isolated."""
+    G = nx.DiGraph()
+    G.add_weighted_edges_from(
+        [
+            ("a", "b", 2), ("b", "a", 1), ("a", "c", 1), ("c", "b", 3),
+            ("d", "a", 1), ("d", "c", 2), ("b", "e", 1), ("c", "e", 4),
+        ]
+    )
+    G.add_node("f")
+    return G
+
+
+def _edges(rows):
+    return pd.DataFrame(rows, columns=["src_id", "dst_id", "edge_type"])
+
+
+class TestPageRankSparse(unittest.TestCase):
+    def test_matches_networkx_with_dangling_nodes(self):
+        G = _reply_graph()
+        ids, A = author_adjacency(G)
+        expected = nx.pagerank(G, alpha=0.85, tol=1.0e-10, weight="weight")
+        got = pagerank_sparse(A, alpha=0.85, tol=1.0e-10)
+        np.testing.assert_allclose(got, [expected[i] for i in ids], atol=1.0e-8)
+        self.assertAlmostEqual(got.sum(), 1.0)
+
+    def test_empty_graph(self):
+        ids, A = author_adjacency(nx.DiGraph())
+        self.assertEqual(nx.pagerank(nx.DiGraph()), {})
+        self.assertEqual(pagerank_sparse(A).shape, (0,))
+
+
+class TestHitsSparse(unittest.TestCase):
+    def test_matches_networkx_with_dangling_nodes(self):
+        G = _reply_graph()
+        ids, A = author_adjacency(G)
+        exp_h, exp_a = nx.hits(G)
+        h, a = hits_sparse(A, max_iter=1000, tol=1.0e-12)
+        np.testing.assert_allclose(h, [exp_h[i] for i in ids], atol=1.0e-6)
+        np.testing.assert_allclose(a, [exp_a[i] for i in ids], atol=1.0e-6)
+
+    def test_empty_graph(self):
+        ids, A = author_adjacency(nx.DiGraph())
+        self.assertEqual(nx.hits(nx.DiGraph()), ({}, {}))
+        h, a = hits_sparse(A)
+        self.assertEqual(h.shape, (0,))
+        self.assertEqual(a.shape, (0,))
+
+
+class TestContainerProjection(unittest.TestCase):
+    def test_matches_networkx_bipartite_projection(self):
+        rows = []
+        membership = {
+            "p1": ("alice", "r/ev"), "p2": ("bob", "r/ev"), "p3": ("alice", "r/india"),
+            "p4": ("bob", "r/india"), "p5": ("carol", "r/india"), "p6": ("carol", "r/cars"),
+            "p7": ("alice", "r/cars"), "p8": ("alice", "r/ev"), "p9": ("dave", "r/solo"),
+        }
+        for post, (author, container) in membership.items():
+            rows.append((post, container, "IN_CONTAINER"))
+            rows.append((post, author, "AUTHORED_BY"))
+        rows.append(("p2", "r/ev", "REPLY_TO"))
+        got = container_projection(_edges(rows))
+
+        B = nx.Graph()
+        containers = {c for _, c in membership.values()}
+        B.add_nodes_from(containers, bipartite=1)
+        B.add_edges_from(("author:" + a, c) for a, c in membership.values())
+        P = bipartite.weighted_projected_graph(B, containers)
+        expected = {tuple(sorted((u, v))): w for u, v, w in P.edges(data="weight")}
+
+        pairs = {(r.container_a, r.container_b): int(r.shared_authors) for r in got.itertuples()}
+        self.assertEqual(pairs, expected)
+        self.assertTrue(got["shared_authors"].is_monotonic_decreasing)
+
+    def test_empty_edges(self):
+        got = container_projection(_edges([]))
+        self.assertEqual(len(got), 0)
+        self.assertEqual(list(got.columns), ["container_a", "container_b", "shared_authors"])
+
+
+if __name__ == "__main__":
+    unittest.main()
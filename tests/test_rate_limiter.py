@@ -0,0 +1,97 @@
+import threading
+import unittest
+from unittest import mock
+
+from crawler.fetch_reddit import _limiter
+from crawler.utils import RateLimiter
+
+
+class _FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping records the delay."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+        patcher = mock.patch.multiple("crawler.utils.time", monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_call_does_not_sleep(self):
+        RateLimiter(2.0).wait()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_calls_are_spaced_by_interval(self):
+        limiter = RateLimiter(4.0)
+        for _ in range(3):
+            limiter.wait()
+        self.assertEqual(self.clock.sleeps, [0.25, 0.5])
+
+    def test_elapsed_time_counts_toward_interval(self):
+        limiter = RateLimiter(1.0)
+        limiter.wait()
+        self.clock.now += 0.75
+        limiter.wait()
+        self.clock.now += 5.0
+        limiter.wait()
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.25)
+
+    def test_non_positive_qps_never_sleeps(self):
+        for qps in (0.0, -1.0):
+            limiter = RateLimiter(qps)
+            limiter.wait()
+            limiter.wait()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_concurrent_callers_get_distinct_slots(self):
+        limiter = RateLimiter(10.0)
+        n = 8
+        barrier = threading.Barrier(n)
+
+        def worker():
+            barrier.wait()
+            limiter.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # With the clock frozen, one caller goes immediately and the rest are
+        # queued one interval apart, whatever order the threads took the lock in
+        sleeps = sorted(self.clock.sleeps)
+        self.assertEqual(len(sleeps), n - 1)
+        for i, s in enumerate(sleeps, start=1):
+            self.assertAlmostEqual(s, i * 0.1)
+
+
+class TestSharedLimiter(unittest.TestCase):
+    def test_one_limiter_per_qps(self):
+        self.assertIs(_limiter(3.5), _limiter(3.5))
+        self.assertIsNot(_limiter(3.5), _limiter(7.0))
+
+    def test_shared_limiter_spaces_across_callers(self):
+        clock = _FakeClock()
+        with mock.patch.multiple("crawler.utils.time", monotonic=clock.monotonic, sleep=clock.sleep):
+            # A qps no other test uses, so the cached limiter starts fresh
+            _limiter(123.0).wait()
+            _limiter(123.0).wait()
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 1.0 / 123.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from crawler.relevance import content_score
+from crawler.relevance import content_score, term_counts
 
 
 class TestRelevance(unittest.TestCase):
@@ -16,6 +16,17 @@ class TestRelevance(unittest.TestCase):
         )
         self.assertGreater(score, 2.0)
 
+    def test_term_counts_counts_nested_terms_separately(self):
+        text = "The Model 3 and the Model Y are both Tesla models."
+        self.assertEqual(term_counts(text.lower(), ["model", "model 3", "tesla"]), [3, 1, 1])
+
+    def test_term_counts_match_content_score_bonus(self):
+        text = "Ola S1 or Ola S1 Pro? Ola keeps it simple."
+        brands = ["ola", "ola s1"]
+        expected = sum(term_counts(text.lower(), brands)) * 0.7
+        score = content_score(text, keywords=[], brand_terms=brands, policy_terms=[], brand_bonus=0.7)
+        self.assertAlmostEqual(score, expected)
+
 
 if __name__ == "__main__":
     unittest.main()